@@ -0,0 +1,79 @@
+"""Startup-time regression check for the todo CLI.
+
+Runs `python -X importtime main.py info` several times, prints the slowest
+imports, and exits non-zero if the median wall time is over budget or if
+modules that only data commands need were imported:
+
+    python bench_startup.py --budget-ms 400
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# Modules `info` must not pull in; they belong to commands that touch data.
+LAZY_MODULES = ("commands", "task_manager", "storage", "sqlite_storage", "bulk", "query", "task")
+
+
+def run_once(args):
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "main.py"] + args,
+        cwd=HERE, capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        sys.stderr.writelines(line for line in proc.stderr.splitlines(True)
+                              if not line.startswith("import time:"))
+        raise SystemExit(f"`main.py {' '.join(args)}` failed with exit code {proc.returncode}")
+    return elapsed, parse_importtime(proc.stderr)
+
+
+def parse_importtime(stderr):
+    """Return {module: cumulative_us} from -X importtime output."""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=400.0)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("command", nargs="*", default=["info"])
+    args = parser.parse_args()
+
+    times = []
+    imports = {}
+    for _ in range(args.runs):
+        elapsed, imports = run_once(args.command)
+        times.append(elapsed)
+    median_ms = statistics.median(times) * 1000
+
+    print(f"main.py {' '.join(args.command)}: median {median_ms:.0f} ms over {args.runs} runs "
+          f"(budget {args.budget_ms:.0f} ms)")
+    print("Slowest imports (cumulative):")
+    for name, us in sorted(imports.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    eager = [m for m in LAZY_MODULES if m in imports]
+    if eager and args.command == ["info"]:
+        print(f"FAIL: imported at startup: {', '.join(eager)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"FAIL: startup over budget by {median_ms - args.budget_ms:.0f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Memory and (de)serialization benchmark for Task.
+
+Compares the slotted Task against the dataclass it replaced:
+
+    python bench_task.py --count 1000000
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+from task import Task
+
+
+@dataclass
+class DataclassTask:
+    id: str
+    description: str
+    completed: bool = False
+    created_at: str = None
+
+    def to_dict(self):
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(data):
+        return DataclassTask(
+            id=data["id"],
+            description=data["description"],
+            completed=data.get("completed", False),
+            created_at=data.get("created_at"),
+        )
+
+
+def make_records(count):
+    return [
+        {"id": "%032x" % i, "description": "task number %d" % i,
+         "completed": i % 3 == 0, "created_at": "2025-10-23T08:44:07.%06d" % (i % 1000000)}
+        for i in range(count)
+    ]
+
+
+def bench(cls, records):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    tasks = [cls.from_dict(d) for d in records]
+    from_dict_s = time.perf_counter() - start
+    per_task = tracemalloc.get_traced_memory()[0] / len(records)
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    dicts = [t.to_dict() for t in tasks]
+    to_dict_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    text = json.dumps(dicts, separators=(",", ":"))
+    dumps_s = time.perf_counter() - start
+    start = time.perf_counter()
+    [cls.from_dict(d) for d in json.loads(text)]
+    load_s = time.perf_counter() - start
+    return per_task, from_dict_s, to_dict_s, dumps_s, load_s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    records = make_records(args.count)
+    n = args.count
+    print(f"{n} tasks")
+    print(f"{'':16}{'bytes/task':>12}{'from_dict/s':>14}{'to_dict/s':>14}{'save s':>9}{'load s':>9}")
+    for name, cls in (("dataclass", DataclassTask), ("slotted Task", Task)):
+        per_task, from_s, to_s, dumps_s, load_s = bench(cls, records)
+        print(f"{name:16}{per_task:12.0f}{n / from_s:14,.0f}{n / to_s:14,.0f}{dumps_s:9.2f}{load_s:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import csv
+import json
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+
+FORMATS = ("jsonl", "csv", "text")
+CSV_FIELDS = ["id", "description", "completed", "created_at"]
+
+
+def guess_format(path: str, fmt: Optional[str] = None) -> str:
+    """Pick a format from the explicit option or the file extension (stdin defaults to jsonl)."""
+    if fmt:
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format: {fmt}")
+        return fmt
+    if path.endswith(".csv"):
+        return "csv"
+    if path.endswith(".txt"):
+        return "text"
+    return "jsonl"
+
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y")
+    return bool(value)
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[Dict]:
+    """Yield task dicts from `stream` one line at a time.
+
+    jsonl: one task object per line; csv: a header row with CSV_FIELDS
+    (only description is required); text: one description per line.
+    """
+    if fmt == "csv":
+        rows: Iterable[Dict] = csv.DictReader(stream)
+    elif fmt == "text":
+        rows = ({"description": line.rstrip("\n")} for line in stream if line.strip())
+    else:
+        rows = (json.loads(line) for line in stream if line.strip())
+    for row in rows:
+        yield {
+            "id": row.get("id") or None,
+            "description": row.get("description", ""),
+            "completed": _parse_bool(row.get("completed", False)),
+            "created_at": row.get("created_at") or None,
+        }
+
+
+def write_records(records: Iterable[Dict], stream: TextIO, fmt: str) -> int:
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for d in records:
+            writer.writerow(d)
+            count += 1
+    elif fmt == "text":
+        for d in records:
+            stream.write(d["description"] + "\n")
+            count += 1
+    else:
+        for d in records:
+            stream.write(json.dumps(d, separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+def read_ids(ids: Iterable[str], stdin: TextIO) -> Iterator[str]:
+    """Expand a '-' argument into ids read from stdin, one per line."""
+    for task_id in ids:
+        if task_id == "-":
+            for line in stdin:
+                line = line.strip()
+                if line:
+                    yield line
+        else:
+            yield task_id
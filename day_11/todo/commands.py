@@ -0,0 +1,107 @@
+"""Implementations of the todo CLI commands.
+
+main.py imports this module only when a data command actually runs, so
+`info` and `--help` never pay for loading storage or tasks.
+"""
+import os
+import sys
+from typing import List, Optional
+import typer
+try:
+    from .bulk import guess_format, read_ids, read_records, write_records
+    from .query import format_record, query_records, write_lines
+    from .storage import Storage, open_storage
+    from .task_manager import TaskManager
+except ImportError:  # run from this directory, e.g. python main.py
+    from bulk import guess_format, read_ids, read_records, write_records
+    from query import format_record, query_records, write_lines
+    from storage import Storage, open_storage
+    from task_manager import TaskManager
+
+_storage = None
+_manager = None
+
+
+def get_storage() -> Storage:
+    # TODO_STORAGE=journal appends each change instead of rewriting tasks.json;
+    # TODO_STORAGE=sqlite keeps tasks in tasks.db and writes single rows.
+    global _storage
+    if _storage is None:
+        _storage = open_storage(os.environ.get("TODO_STORAGE", "json"))
+    return _storage
+
+
+def get_manager() -> TaskManager:
+    """Load tasks into a TaskManager the first time a command needs one."""
+    global _manager
+    if _manager is None:
+        _manager = TaskManager(get_storage())
+    return _manager
+
+def add(description: str):
+    """Add a new task."""
+    try:
+        task = get_manager().add_task(description)
+        typer.echo(f"Task added: {task.id} | {task.description}")
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+
+def list_tasks(status: str, since: Optional[str], limit: Optional[int], offset: int,
+               sort: Optional[str]):
+    """List tasks, streamed straight from storage."""
+    try:
+        records = query_records(get_storage().iter_records(), status=status, since=since,
+                                sort=sort, limit=limit, offset=offset)
+        count = write_lines((format_record(d) for d in records), sys.stdout)
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Exit(1)
+    if not count:
+        typer.echo("No tasks available.")
+
+def complete(task_ids: List[str]):
+    """Mark one or more tasks as completed."""
+    ids = list(read_ids(task_ids, sys.stdin))
+    done = get_manager().complete_tasks(ids)
+    if len(ids) == 1:
+        typer.echo("Task marked as completed." if done else "Task not found.")
+    else:
+        typer.echo(f"{done} of {len(ids)} tasks marked as completed.")
+
+def delete(task_ids: List[str]):
+    """Delete one or more tasks."""
+    ids = list(read_ids(task_ids, sys.stdin))
+    done = get_manager().delete_tasks(ids)
+    if len(ids) == 1:
+        typer.echo("Task deleted." if done else "Task not found.")
+    else:
+        typer.echo(f"{done} of {len(ids)} tasks deleted.")
+
+def import_tasks(source: str, fmt: Optional[str]):
+    """Import tasks in bulk with a single save."""
+    try:
+        fmt = guess_format(source, fmt)
+        if source == "-":
+            count = get_manager().import_tasks(read_records(sys.stdin, fmt))
+        else:
+            with open(source, "r", encoding="utf-8", newline="") as f:
+                count = get_manager().import_tasks(read_records(f, fmt))
+    except (OSError, ValueError) as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Exit(1)
+    typer.echo(f"Imported {count} tasks.")
+
+def export(dest: str, fmt: Optional[str]):
+    """Export all tasks."""
+    try:
+        fmt = guess_format(dest, fmt)
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Exit(1)
+    records = get_storage().iter_records()
+    if dest == "-":
+        write_records(records, sys.stdout, fmt)
+        return
+    with open(dest, "w", encoding="utf-8", newline="") as f:
+        count = write_records(records, f, fmt)
+    typer.echo(f"Exported {count} tasks to {dest}.")
@@ -1,46 +1,60 @@
+from typing import List, Optional
 import typer
-from task_manager import TaskManager
 
 app = typer.Typer(help="A simple CLI TODO application powered by Typer.")
-manager = TaskManager()
+
+
+def _commands():
+    # Storage, TaskManager and the bulk/query helpers load only when a data
+    # command runs; `info` and `--help` stay at the cost of importing typer.
+    try:
+        from . import commands
+    except ImportError:  # run from this directory, e.g. python main.py
+        import commands
+    return commands
 
 @app.command(name="add")
 def add(description: str = typer.Argument(..., help="Description of the task to add")):
     """Add a new task."""
-    try:
-        task = manager.add_task(description)
-        typer.echo(f"Task added: {task.id} | {task.description}")
-    except ValueError as e:
-        typer.echo(f"Error: {e}")
+    _commands().add(description)
 
 @app.command(name="list")
-def list_tasks():
-    """List all tasks."""
-    tasks = manager.get_all_tasks()
-    if not tasks:
-        typer.echo("No tasks available.")
-        return
-    for t in tasks:
-        status = "Completed" if t.completed else "Incomplete"
-        typer.echo(f"{t.id} | {status} | {t.description}")
+def list_tasks(
+    status: str = typer.Option("all", "--status", help="all, completed or pending"),
+    since: Optional[str] = typer.Option(None, "--since", help="Only tasks created on/after this ISO date"),
+    limit: Optional[int] = typer.Option(None, "--limit", min=0, help="Show at most this many tasks"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Skip this many tasks first"),
+    sort: Optional[str] = typer.Option(
+        None, "--sort", help="Sort by created or description; prefix with '-' for descending"),
+):
+    """List tasks, streamed straight from storage."""
+    _commands().list_tasks(status, since, limit, offset, sort)
 
 @app.command(name="complete")
-def complete(task_id: str):
-    """Mark a task as completed."""
-    ok = manager.mark_completed(task_id)
-    if ok:
-        typer.echo("Task marked as completed.")
-    else:
-        typer.echo("Task not found.")
+def complete(task_ids: List[str] = typer.Argument(..., help="Task ids to complete ('-' reads ids from stdin)")):
+    """Mark one or more tasks as completed."""
+    _commands().complete(task_ids)
 
 @app.command(name="delete")
-def delete(task_id: str):
-    """Delete a task."""
-    ok = manager.delete_task(task_id)
-    if ok:
-        typer.echo("Task deleted.")
-    else:
-        typer.echo("Task not found.")
+def delete(task_ids: List[str] = typer.Argument(..., help="Task ids to delete ('-' reads ids from stdin)")):
+    """Delete one or more tasks."""
+    _commands().delete(task_ids)
+
+@app.command(name="import")
+def import_tasks(
+    source: str = typer.Argument("-", help="JSONL, CSV or text file to import ('-' for stdin)"),
+    fmt: Optional[str] = typer.Option(None, "--format", help="jsonl, csv or text (default: from extension)"),
+):
+    """Import tasks in bulk with a single save."""
+    _commands().import_tasks(source, fmt)
+
+@app.command(name="export")
+def export(
+    dest: str = typer.Argument("-", help="File to write ('-' for stdout)"),
+    fmt: Optional[str] = typer.Option(None, "--format", help="jsonl, csv or text (default: from extension)"),
+):
+    """Export all tasks."""
+    _commands().export(dest, fmt)
 
 @app.command(name="info")
 def info():
@@ -48,5 +62,9 @@ def info():
     typer.echo("CLI TODO Application — Typer Version")
 
 
-if __name__ == "__main__":
+def main():
     app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import datetime
+import heapq
+import itertools
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+
+STATUSES = ("all", "completed", "pending")
+SORT_KEYS = {
+    "created": lambda d: d.get("created_at") or "",
+    "description": lambda d: d["description"],
+}
+
+
+def filter_status(records: Iterable[Dict], status: str) -> Iterator[Dict]:
+    if status not in STATUSES:
+        raise ValueError(f"Unknown status: {status}")
+    if status == "all":
+        return iter(records)
+    wanted = status == "completed"
+    return (d for d in records if bool(d.get("completed")) == wanted)
+
+
+def filter_since(records: Iterable[Dict], since: Optional[str]) -> Iterator[Dict]:
+    if not since:
+        return iter(records)
+    # Normalise so a bare date compares correctly against full ISO timestamps
+    since = datetime.datetime.fromisoformat(since).isoformat()
+    return (d for d in records if (d.get("created_at") or "") >= since)
+
+
+def query_records(records: Iterable[Dict], status: str = "all", since: Optional[str] = None,
+                  sort: Optional[str] = None, limit: Optional[int] = None,
+                  offset: int = 0) -> Iterator[Dict]:
+    """Filter, sort and page task dicts lazily.
+
+    `sort` is a key from SORT_KEYS, prefixed with '-' for descending. Without
+    a sort the storage order is kept and records are pulled only up to the
+    requested page; with a sort and a limit only offset+limit records are
+    kept in a heap rather than sorting everything.
+    """
+    rows = filter_since(filter_status(records, status), since)
+    if sort:
+        reverse = sort.startswith("-")
+        name = sort.lstrip("-")
+        if name not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {name}")
+        key = SORT_KEYS[name]
+        if limit is not None:
+            pick = heapq.nlargest if reverse else heapq.nsmallest
+            rows = iter(pick(offset + limit, rows, key=key))
+        else:
+            rows = iter(sorted(rows, key=key, reverse=reverse))
+    stop = None if limit is None else offset + limit
+    return itertools.islice(rows, offset, stop)
+
+
+def format_record(d: Dict) -> str:
+    status = "Completed" if d.get("completed") else "Incomplete"
+    return f"{d['id']} | {status} | {d['description']}"
+
+
+def write_lines(lines: Iterable[str], stream: TextIO, chunk_size: int = 1000) -> int:
+    """Write lines in chunks instead of one write call per line. Returns the line count."""
+    lines = iter(lines)
+    count = 0
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            break
+        stream.write("\n".join(chunk) + "\n")
+        count += len(chunk)
+    stream.flush()
+    return count
@@ -0,0 +1,93 @@
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+# Fixed SQL text so sqlite3's statement cache reuses the prepared statements.
+_CREATE = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    description TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT
+)
+"""
+_SELECT_ALL = "SELECT id, description, completed, created_at FROM tasks ORDER BY rowid"
+_INSERT = "INSERT INTO tasks (id, description, completed, created_at) VALUES (?, ?, ?, ?)"
+_UPDATE = "UPDATE tasks SET description = ?, completed = ?, created_at = ? WHERE id = ?"
+_DELETE = "DELETE FROM tasks WHERE id = ?"
+_DELETE_ALL = "DELETE FROM tasks"
+
+
+class SQLiteStorage:
+    """Task storage backed by a SQLite database in WAL mode.
+
+    Implements the same ``save``/``load`` interface as ``Storage`` plus
+    row-level ``insert``/``update``/``delete``, each committed on its own
+    unless grouped with ``transaction()``.
+    """
+
+    incremental = True
+
+    def __init__(self, filename: str = "tasks.db"):
+        self.filename = filename
+        # Autocommit mode; transactions are opened explicitly in transaction().
+        self.conn = sqlite3.connect(filename, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute(_CREATE)
+        self._depth = 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into one atomic commit. Nested calls join the outer one."""
+        if self._depth:
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        self._depth = 1
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self.conn.execute("COMMIT")
+        finally:
+            self._depth = 0
+
+    def save(self, tasks: List[Dict]) -> None:
+        with self.transaction():
+            self.conn.execute(_DELETE_ALL)
+            self.conn.executemany(_INSERT, (self._row(t) for t in tasks))
+
+    def load(self) -> List[Dict]:
+        return list(self.iter_records())
+
+    def iter_records(self) -> Iterator[Dict]:
+        # Rows are fetched from the cursor as the caller consumes them
+        for r in self.conn.execute(_SELECT_ALL):
+            yield {"id": r[0], "description": r[1], "completed": bool(r[2]), "created_at": r[3]}
+
+    def insert(self, task: Dict) -> None:
+        self.conn.execute(_INSERT, self._row(task))
+
+    def update(self, task: Dict) -> None:
+        self.conn.execute(
+            _UPDATE,
+            (task["description"], int(task.get("completed", False)), task.get("created_at"), task["id"]),
+        )
+
+    def delete(self, task_id: str) -> None:
+        self.conn.execute(_DELETE, (task_id,))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    @staticmethod
+    def _row(task: Dict) -> tuple:
+        return (task["id"], task["description"], int(task.get("completed", False)), task.get("created_at"))
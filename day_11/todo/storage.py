@@ -1,20 +1,271 @@
 import json
-from typing import List, Dict
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_GENERATION_RE = re.compile(r'\s*\{\s*"generation"\s*:\s*(\d+)')
+
+
+class ConflictError(Exception):
+    """Raised by save() when another writer has saved since our last load/save."""
+
+
+class CorruptStorageError(ValueError):
+    """Raised by load() when the task file exists but is not valid JSON."""
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on `path` (created if missing) across processes."""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10s; keep waiting
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def write_json_atomic(path: str, data, indent: Optional[int] = None) -> None:
+    """Write to a temp file and os.replace it, so readers never see a partial file."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            if indent is None:
+                json.dump(data, f, separators=(",", ":"))
+            else:
+                json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
 
 class Storage:
+    # Storages that can persist a single task change implement insert/update/delete
+    # and set this flag; TaskManager falls back to a full save() otherwise.
+    incremental = False
+
     def __init__(self, filename: str = "tasks.json"):
         self.filename = filename
+        self.lock_filename = filename + ".lock"
+        # Generation of the file as of our last load/save; a plain JSON list is generation 0.
+        self.generation = 0
 
     def save(self, tasks: List[Dict]) -> None:
-        with open(self.filename, "w", encoding="utf-8") as f:
-            json.dump(tasks, f, indent=2)
+        with file_lock(self.lock_filename):
+            current = self._read_generation()
+            if current != self.generation:
+                raise ConflictError(f"{self.filename} is at generation {current}, expected {self.generation}")
+            write_json_atomic(self.filename, {"generation": current + 1, "tasks": tasks}, indent=2)
+            self.generation = current + 1
 
     def load(self) -> List[Dict]:
+        self.generation, tasks = self._read()
+        return tasks
+
+    def _read(self) -> Tuple[int, List[Dict]]:
         try:
             with open(self.filename, "r", encoding="utf-8") as f:
-                return json.load(f)
+                text = f.read()
+        except FileNotFoundError:
+            return 0, []
+        if not text.strip():
+            return 0, []
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            # Loading it as empty would let the next save overwrite every task
+            raise CorruptStorageError(f"{self.filename} is corrupt ({e}); "
+                                      "restore or move it aside before saving") from e
+        if isinstance(data, dict):
+            return data.get("generation", 0), data.get("tasks", [])
+        return 0, data
+
+    def _read_generation(self) -> int:
+        # The generation is written first, so the file head is enough.
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                head = f.read(64)
+        except FileNotFoundError:
+            return 0
+        match = _GENERATION_RE.match(head)
+        return int(match.group(1)) if match else 0
+
+    def iter_records(self) -> Iterator[Dict]:
+        return iter(self.load())
+
+
+class JournalStorage(Storage):
+    """JSON snapshot plus an append-only JSONL journal of task operations.
+
+    Each mutation appends one compact record to ``<filename>.journal``; ``load``
+    replays the journal over the snapshot. Once the journal grows past
+    ``compact_threshold`` bytes it is rotated aside and folded into a new
+    snapshot, in a background thread unless ``background`` is False.
+    """
+
+    incremental = True
+
+    def __init__(self, filename: str = "tasks.json", compact_threshold: int = 1024 * 1024,
+                 background: bool = True):
+        super().__init__(filename)
+        self.journal_filename = filename + ".journal"
+        self.compacting_filename = filename + ".journal.compacting"
+        self.compact_threshold = compact_threshold
+        self.background = background
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._pending: Optional[List[str]] = None
+
+    def load(self) -> List[Dict]:
+        # Locked so another process cannot rotate the journal between the two replays.
+        with file_lock(self.lock_filename):
+            tasks = {d["id"]: d for d in self._read()[1]}
+            # A journal left mid-compaction still has to be applied before the live one.
+            self._replay(self.compacting_filename, tasks)
+            self._replay(self.journal_filename, tasks)
+        return list(tasks.values())
+
+    def save(self, tasks: List[Dict]) -> None:
+        self.wait()
+        with file_lock(self.lock_filename):
+            self._write_snapshot(tasks)
+            for path in (self.compacting_filename, self.journal_filename):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def insert(self, task: Dict) -> None:
+        self._append({"op": "insert", "task": task})
+
+    def update(self, task: Dict) -> None:
+        self._append({"op": "update", "task": task})
+
+    def delete(self, task_id: str) -> None:
+        self._append({"op": "delete", "id": task_id})
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Buffer the records written inside the block and append them in one write."""
+        if self._pending is not None:
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+            lines = self._pending
+        finally:
+            self._pending = None
+        if lines:
+            self._write_lines(lines)
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot."""
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            with file_lock(self.lock_filename):
+                # Only rotate if no earlier compaction was interrupted; otherwise fold that one first.
+                if not os.path.exists(self.compacting_filename):
+                    if not os.path.exists(self.journal_filename):
+                        return
+                    os.replace(self.journal_filename, self.compacting_filename)
+            if self.background:
+                self._compactor = threading.Thread(target=self._fold, name="todo-journal-compactor")
+                self._compactor.start()
+            else:
+                self._fold()
+
+    def wait(self) -> None:
+        """Block until a running background compaction has finished."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def _append(self, record: Dict) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        if self._pending is not None:
+            self._pending.append(line)
+        else:
+            self._write_lines([line])
+
+    def _write_lines(self, lines: List[str]) -> None:
+        # Appends from other processes only need the lock against a concurrent rotation;
+        # the records themselves merge on replay since each carries the whole task.
+        with file_lock(self.lock_filename):
+            with open(self.journal_filename, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+                size = f.tell()
+        if size >= self.compact_threshold:
+            self.compact()
+
+    def _fold(self) -> None:
+        with file_lock(self.lock_filename):
+            if not os.path.exists(self.compacting_filename):
+                # Another process folded it first
+                return
+            tasks = {d["id"]: d for d in self._read()[1]}
+            self._replay(self.compacting_filename, tasks)
+            self._write_snapshot(list(tasks.values()))
+            os.remove(self.compacting_filename)
+
+    def _write_snapshot(self, tasks: List[Dict]) -> None:
+        write_json_atomic(self.filename, tasks)
+
+    @staticmethod
+    def _replay(path: str, tasks: Dict[str, Dict]) -> None:
+        # insert/update carry the full task, so replaying a journal twice is harmless.
+        # An update to a task another writer deleted is dropped, as in TaskManager._merge.
+        try:
+            f = open(path, "r", encoding="utf-8")
         except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            # Corrupt file -> return empty list
-            return []
\ No newline at end of file
+            return
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn trailing write from a crash -> ignore it
+                    continue
+                if record["op"] == "delete":
+                    tasks.pop(record["id"], None)
+                elif record["op"] == "insert" or record["task"]["id"] in tasks:
+                    task = record["task"]
+                    tasks[task["id"]] = task
+
+
+def open_storage(kind: str = "json", filename: Optional[str] = None) -> Storage:
+    if kind == "json":
+        return Storage(filename or "tasks.json")
+    if kind == "journal":
+        return JournalStorage(filename or "tasks.json")
+    if kind == "sqlite":
+        try:
+            from .sqlite_storage import SQLiteStorage
+        except ImportError:  # run from this directory, e.g. via main.py
+            from sqlite_storage import SQLiteStorage
+        return SQLiteStorage(filename or "tasks.db")
+    raise ValueError(f"Unknown storage kind: {kind}")
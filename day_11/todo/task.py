@@ -1,34 +1,48 @@
-from dataclasses import dataclass, asdict
-from typing import Dict
+from typing import Dict, Optional
 import datetime
 import uuid
 
-@dataclass
 class Task:
-    id: str
-    description: str
-    completed: bool = False
-    created_at: str = None
+    # Plain slotted class rather than a dataclass: no per-instance __dict__, and
+    # to_dict/from_dict below avoid dataclasses.asdict's recursive deep copy.
+    __slots__ = ("id", "description", "completed", "created_at")
 
-    def __post_init__(self):
-        if self.created_at is None:
+    def __init__(self, id: str, description: str, completed: bool = False,
+                 created_at: Optional[str] = None):
+        self.id = id
+        self.description = description
+        self.completed = completed
+        if created_at is None:
             # ISO format timestamp
-            self.created_at = datetime.datetime.utcnow().isoformat()
+            created_at = datetime.datetime.utcnow().isoformat()
+        self.created_at = created_at
+
+    def __repr__(self) -> str:
+        return (f"Task(id={self.id!r}, description={self.description!r}, "
+                f"completed={self.completed!r}, created_at={self.created_at!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.id, self.description, self.completed, self.created_at) == \
+            (other.id, other.description, other.completed, other.created_at)
+
+    __hash__ = None  # mutable, like the dataclass it replaces
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "description": self.description,
+            "completed": self.completed,
+            "created_at": self.created_at,
+        }
 
     @staticmethod
     def from_dict(data: Dict) -> "Task":
-        return Task(
-            id=data["id"],
-            description=data["description"],
-            completed=data.get("completed", False),
-            created_at=data.get("created_at"),
-        )
+        return Task(data["id"], data["description"], data.get("completed", False), data.get("created_at"))
 
     @staticmethod
     def create(description: str) -> "Task":
         if not description or not description.strip():
             raise ValueError("Description cannot be empty")
-        return Task(id=str(uuid.uuid4()), description=description.strip())
\ No newline at end of file
+        return Task(id=str(uuid.uuid4()), description=description.strip())
@@ -1,48 +1,197 @@
-from typing import List, Optional
-from task import Task
-from storage import Storage
+import bisect
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+try:
+    from .task import Task
+    from .storage import ConflictError, Storage
+except ImportError:  # run from this directory, e.g. via main.py
+    from task import Task
+    from storage import ConflictError, Storage
 
 class TaskManager:
+    # How many times _save reloads and re-applies our changes after losing a write race
+    MAX_SAVE_RETRIES = 10
+
     def __init__(self, storage: Optional[Storage] = None):
         self.storage = storage or Storage()
-        self.tasks: List[Task] = []
+        # id -> Task in insertion order; this is the primary store behind `tasks`.
+        self._by_id: Dict[str, Task] = {}
+        # completed flag -> {id: Task}
+        self._by_status: Dict[bool, Dict[str, Task]] = {False: {}, True: {}}
+        # (created_at, id) pairs kept sorted; None while a batch has left it stale
+        self._by_created: Optional[List[Tuple[str, str]]] = []
+        self._batch_depth = 0
+        self._dirty = False
+        # Changes not yet saved by a whole-file storage, replayed onto a fresh load on conflict
+        self._ops: List[Tuple[str, Dict]] = []
         self._load()
 
+    @property
+    def tasks(self) -> List[Task]:
+        return list(self._by_id.values())
+
     def _load(self) -> None:
         raw = self.storage.load()
-        self.tasks = [Task.from_dict(d) for d in raw]
+        self._by_id = {}
+        self._by_status = {False: {}, True: {}}
+        for d in raw:
+            task = Task.from_dict(d)
+            self._by_id[task.id] = task
+            self._by_status[task.completed][task.id] = task
+        self._by_created = sorted((t.created_at, t.id) for t in self._by_id.values())
 
     def _save(self) -> None:
-        self.storage.save([t.to_dict() for t in self.tasks])
+        for _ in range(self.MAX_SAVE_RETRIES):
+            try:
+                self.storage.save([t.to_dict() for t in self._by_id.values()])
+            except ConflictError:
+                # Another process saved first: reload its state and re-apply our changes.
+                self._merge()
+                continue
+            self._ops = []
+            return
+        raise ConflictError(f"Gave up saving after {self.MAX_SAVE_RETRIES} conflicting writes")
+
+    def _merge(self) -> None:
+        ops = self._ops
+        self._load()
+        for op, data in ops:
+            old = self._by_id.get(data["id"])
+            if op == "delete":
+                if old:
+                    self._unindex(old)
+            elif op == "insert" or old:
+                # An update to a task someone else deleted is dropped
+                if old:
+                    self._unindex(old)
+                self._index(Task.from_dict(data))
+        self._ops = ops
+
+    def _write(self, op: str, task: Task) -> None:
+        # Persist just this task when the storage supports it, else rewrite everything.
+        if not self.storage.incremental:
+            self._ops.append((op, {"id": task.id} if op == "delete" else task.to_dict()))
+            if self._batch_depth:
+                self._dirty = True
+            else:
+                self._save()
+        elif op == "delete":
+            self.storage.delete(task.id)
+        else:
+            getattr(self.storage, op)(task.to_dict())
+
+    def _index(self, task: Task) -> None:
+        self._by_id[task.id] = task
+        self._by_status[task.completed][task.id] = task
+        if self._batch_depth:
+            # Re-sorted once on demand instead of one insort per task
+            self._by_created = None
+        elif self._by_created is not None:
+            bisect.insort(self._by_created, (task.created_at, task.id))
+
+    def _unindex(self, task: Task) -> None:
+        del self._by_id[task.id]
+        del self._by_status[task.completed][task.id]
+        if self._batch_depth:
+            # Deleting from the middle shifts the list, so a batch re-sorts once instead
+            self._by_created = None
+        if self._by_created is None:
+            return
+        key = (task.created_at, task.id)
+        i = bisect.bisect_left(self._by_created, key)
+        if i < len(self._by_created) and self._by_created[i] == key:
+            del self._by_created[i]
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Apply many mutations with a single save (or one storage transaction).
+
+        If the outermost block raises, nothing is persisted and the in-memory
+        tasks are reloaded from storage.
+        """
+        self._batch_depth += 1
+        try:
+            if self.storage.incremental:
+                with self.storage.transaction():
+                    yield
+            else:
+                yield
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                # Otherwise the next mutation's save would write the partial batch
+                self._dirty = False
+                self._ops = []
+                self._load()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._dirty:
+            self._dirty = False
+            self._save()
 
     def add_task(self, description: str) -> Task:
         task = Task.create(description)
-        self.tasks.append(task)
-        self._save()
+        self._index(task)
+        self._write("insert", task)
         return task
 
     def get_all_tasks(self) -> List[Task]:
-        return list(self.tasks)
+        return list(self._by_id.values())
+
+    def get_tasks_by_status(self, completed: bool) -> List[Task]:
+        return list(self._by_status[completed].values())
+
+    def get_tasks_by_created(self, reverse: bool = False) -> List[Task]:
+        if self._by_created is None:
+            self._by_created = sorted((t.created_at, t.id) for t in self._by_id.values())
+        keys = reversed(self._by_created) if reverse else self._by_created
+        return [self._by_id[task_id] for _, task_id in keys]
 
     def find_task(self, task_id: str) -> Optional[Task]:
-        for t in self.tasks:
-            if t.id == task_id:
-                return t
-        return None
+        return self._by_id.get(task_id)
 
     def mark_completed(self, task_id: str) -> bool:
         task = self.find_task(task_id)
         if not task:
             return False
         if not task.completed:
+            del self._by_status[False][task.id]
             task.completed = True
-            self._save()
+            self._by_status[True][task.id] = task
+            self._write("update", task)
         return True
 
     def delete_task(self, task_id: str) -> bool:
         task = self.find_task(task_id)
         if not task:
             return False
-        self.tasks.remove(task)
-        self._save()
-        return True
\ No newline at end of file
+        self._unindex(task)
+        self._write("delete", task)
+        return True
+
+    def import_tasks(self, records: Iterable[Dict]) -> int:
+        """Add tasks from dicts; a record whose id already exists replaces that task."""
+        count = 0
+        with self.batch():
+            for d in records:
+                if d.get("id"):
+                    task = Task.from_dict(d)
+                else:
+                    task = Task.create(d.get("description", ""))
+                    task.completed = bool(d.get("completed", False))
+                    task.created_at = d.get("created_at") or task.created_at
+                old = self._by_id.get(task.id)
+                if old:
+                    self._unindex(old)
+                self._index(task)
+                self._write("update" if old else "insert", task)
+                count += 1
+        return count
+
+    def complete_tasks(self, task_ids: Iterable[str]) -> int:
+        with self.batch():
+            return sum(1 for task_id in task_ids if self.mark_completed(task_id))
+
+    def delete_tasks(self, task_ids: Iterable[str]) -> int:
+        with self.batch():
+            return sum(1 for task_id in task_ids if self.delete_task(task_id))
@@ -0,0 +1,33 @@
+import unittest
+import io
+from day_11.todo.bulk import guess_format, read_ids, read_records, write_records
+
+class TestBulk(unittest.TestCase):
+    def test_guess_format(self):
+        self.assertEqual(guess_format("tasks.csv"), "csv")
+        self.assertEqual(guess_format("tasks.txt"), "text")
+        self.assertEqual(guess_format("-"), "jsonl")
+        self.assertEqual(guess_format("tasks.csv", "jsonl"), "jsonl")
+        with self.assertRaises(ValueError):
+            guess_format("-", "xml")
+
+    def test_read_csv(self):
+        stream = io.StringIO("description,completed\nbuy milk,true\nwalk,0\n")
+        records = list(read_records(stream, "csv"))
+        self.assertEqual([r["description"] for r in records], ["buy milk", "walk"])
+        self.assertEqual([r["completed"] for r in records], [True, False])
+        self.assertIsNone(records[0]["id"])
+
+    def test_jsonl_round_trip(self):
+        data = [{"id": "1", "description": "a", "completed": True, "created_at": "2025-01-01T00:00:00"}]
+        out = io.StringIO()
+        self.assertEqual(write_records(data, out, "jsonl"), 1)
+        self.assertEqual(list(read_records(io.StringIO(out.getvalue()), "jsonl")), data)
+
+    def test_read_text_skips_blank_lines(self):
+        records = list(read_records(io.StringIO("one\n\ntwo\n"), "text"))
+        self.assertEqual([r["description"] for r in records], ["one", "two"])
+
+    def test_read_ids_from_stdin(self):
+        ids = list(read_ids(["a", "-", "d"], io.StringIO("b\n\nc\n")))
+        self.assertEqual(ids, ["a", "b", "c", "d"])
@@ -0,0 +1,93 @@
+import unittest
+import tempfile
+import shutil
+import os
+from day_11.todo.storage import JournalStorage
+from day_11.todo.task_manager import TaskManager
+
+class TestJournalStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "tasks.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_replay_operations(self):
+        s = JournalStorage(self.filename)
+        s.insert({"id": "1", "description": "a", "completed": False})
+        s.insert({"id": "2", "description": "b", "completed": False})
+        s.update({"id": "1", "description": "a", "completed": True})
+        s.delete("2")
+        self.assertFalse(os.path.exists(self.filename))
+        self.assertEqual(s.load(), [{"id": "1", "description": "a", "completed": True}])
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        s = JournalStorage(self.filename, compact_threshold=200, background=True)
+        for i in range(20):
+            s.insert({"id": str(i), "description": "task %d" % i, "completed": False})
+        s.delete("0")
+        s.wait()
+        self.assertTrue(os.path.exists(self.filename))
+        # The last append may itself have rotated the journal away
+        if os.path.exists(s.journal_filename):
+            with open(s.journal_filename, encoding="utf-8") as f:
+                self.assertLess(len(f.readlines()), 21)
+        self.assertEqual([d["id"] for d in s.load()], [str(i) for i in range(1, 20)])
+
+    def test_interrupted_compaction_is_replayed(self):
+        s = JournalStorage(self.filename)
+        s.insert({"id": "1", "description": "a"})
+        os.replace(s.journal_filename, s.compacting_filename)
+        s.insert({"id": "2", "description": "b"})
+        self.assertEqual([d["id"] for d in s.load()], ["1", "2"])
+
+    def test_torn_trailing_record_ignored(self):
+        s = JournalStorage(self.filename)
+        s.insert({"id": "1", "description": "a"})
+        with open(s.journal_filename, "a", encoding="utf-8") as f:
+            f.write('{"op":"insert","task":{"id":"2"')
+        self.assertEqual(s.load(), [{"id": "1", "description": "a"}])
+
+    def test_manager_appends_instead_of_rewriting(self):
+        manager = TaskManager(JournalStorage(self.filename, background=False))
+        t1 = manager.add_task("one")
+        t2 = manager.add_task("two")
+        manager.mark_completed(t1.id)
+        manager.delete_task(t2.id)
+        with open(manager.storage.journal_filename, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 4)
+        reloaded = TaskManager(JournalStorage(self.filename))
+        self.assertEqual([t.id for t in reloaded.get_all_tasks()], [t1.id])
+        self.assertTrue(reloaded.find_task(t1.id).completed)
+
+    def test_batch_is_one_append(self):
+        manager = TaskManager(JournalStorage(self.filename, background=False))
+        with manager.batch():
+            manager.import_tasks({"description": "t%d" % i} for i in range(100))
+        self.assertEqual(len(TaskManager(JournalStorage(self.filename)).get_all_tasks()), 100)
+
+    def test_batch_discarded_on_error(self):
+        manager = TaskManager(JournalStorage(self.filename, background=False))
+        kept = manager.add_task("kept")
+        with self.assertRaises(RuntimeError):
+            with manager.batch():
+                manager.add_task("lost")
+                manager.delete_task(kept.id)
+                raise RuntimeError("boom")
+        self.assertEqual([t.id for t in manager.get_all_tasks()], [kept.id])
+        manager.add_task("later")
+        reloaded = TaskManager(JournalStorage(self.filename))
+        self.assertEqual([t.description for t in reloaded.get_all_tasks()], ["kept", "later"])
+
+    def test_update_after_concurrent_delete_is_dropped(self):
+        a = TaskManager(JournalStorage(self.filename, background=False))
+        kept = a.add_task("kept")
+        gone = a.add_task("gone")
+        b = TaskManager(JournalStorage(self.filename, background=False))
+        b.delete_task(gone.id)
+        a.mark_completed(gone.id)
+        a.mark_completed(kept.id)
+        reloaded = TaskManager(JournalStorage(self.filename))
+        self.assertEqual([t.id for t in reloaded.get_all_tasks()], [kept.id])
+        self.assertTrue(reloaded.find_task(kept.id).completed)
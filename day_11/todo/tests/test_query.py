@@ -0,0 +1,44 @@
+import unittest
+import io
+from day_11.todo.query import format_record, query_records, write_lines
+
+RECORDS = [
+    {"id": "1", "description": "b", "completed": True, "created_at": "2025-01-03T10:00:00"},
+    {"id": "2", "description": "a", "completed": False, "created_at": "2025-01-01T10:00:00"},
+    {"id": "3", "description": "c", "completed": False, "created_at": "2025-01-02T10:00:00"},
+]
+
+def ids(records):
+    return [d["id"] for d in records]
+
+class TestQuery(unittest.TestCase):
+    def test_filter_status(self):
+        self.assertEqual(ids(query_records(RECORDS, status="pending")), ["2", "3"])
+        self.assertEqual(ids(query_records(RECORDS, status="completed")), ["1"])
+        with self.assertRaises(ValueError):
+            query_records(RECORDS, status="done")
+
+    def test_filter_since(self):
+        self.assertEqual(ids(query_records(RECORDS, since="2025-01-02")), ["1", "3"])
+
+    def test_sort_and_page(self):
+        self.assertEqual(ids(query_records(RECORDS, sort="created")), ["2", "3", "1"])
+        self.assertEqual(ids(query_records(RECORDS, sort="-created", limit=2)), ["1", "3"])
+        self.assertEqual(ids(query_records(RECORDS, sort="description", limit=1, offset=1)), ["1"])
+        with self.assertRaises(ValueError):
+            query_records(RECORDS, sort="priority")
+
+    def test_unsorted_page_is_lazy(self):
+        pulled = []
+        def source():
+            for d in RECORDS:
+                pulled.append(d["id"])
+                yield d
+        self.assertEqual(ids(query_records(source(), limit=1)), ["1"])
+        self.assertEqual(pulled, ["1"])
+
+    def test_write_lines(self):
+        out = io.StringIO()
+        count = write_lines((format_record(d) for d in RECORDS), out, chunk_size=2)
+        self.assertEqual(count, 3)
+        self.assertEqual(out.getvalue().splitlines()[0], "1 | Completed | b")
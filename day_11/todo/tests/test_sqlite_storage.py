@@ -0,0 +1,70 @@
+import unittest
+import tempfile
+import shutil
+import os
+from day_11.todo.sqlite_storage import SQLiteStorage
+from day_11.todo.storage import open_storage
+from day_11.todo.task_manager import TaskManager
+
+class TestSQLiteStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "tasks.db")
+        self.storage = SQLiteStorage(self.filename)
+
+    def tearDown(self):
+        self.storage.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_save_and_load(self):
+        data = [
+            {"id": "1", "description": "a", "completed": False, "created_at": "2025-01-01T00:00:00"},
+            {"id": "2", "description": "b", "completed": True, "created_at": "2025-01-02T00:00:00"},
+        ]
+        self.storage.save(data)
+        self.assertEqual(self.storage.load(), data)
+        self.storage.save(data[:1])
+        self.assertEqual(self.storage.load(), data[:1])
+
+    def test_wal_mode(self):
+        mode = self.storage.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_row_operations(self):
+        self.storage.insert({"id": "1", "description": "a", "completed": False, "created_at": "x"})
+        self.storage.insert({"id": "2", "description": "b", "completed": False, "created_at": "y"})
+        self.storage.update({"id": "1", "description": "a", "completed": True, "created_at": "x"})
+        self.storage.delete("2")
+        self.assertEqual(self.storage.load(),
+                         [{"id": "1", "description": "a", "completed": True, "created_at": "x"}])
+
+    def test_transaction_rolls_back_on_error(self):
+        self.storage.insert({"id": "1", "description": "a"})
+        with self.assertRaises(RuntimeError):
+            with self.storage.transaction():
+                self.storage.delete("1")
+                self.storage.insert({"id": "2", "description": "b"})
+                raise RuntimeError("boom")
+        self.assertEqual([d["id"] for d in self.storage.load()], ["1"])
+
+    def test_manager_writes_rows(self):
+        manager = TaskManager(self.storage)
+        t1 = manager.add_task("one")
+        t2 = manager.add_task("two")
+        manager.mark_completed(t1.id)
+        manager.delete_task(t2.id)
+        other = SQLiteStorage(self.filename)
+        try:
+            reloaded = TaskManager(other)
+            self.assertEqual([t.id for t in reloaded.get_all_tasks()], [t1.id])
+            self.assertTrue(reloaded.find_task(t1.id).completed)
+        finally:
+            other.close()
+
+    def test_open_storage(self):
+        storage = open_storage("sqlite", self.filename)
+        try:
+            self.assertIsInstance(storage, SQLiteStorage)
+            self.assertEqual(storage.load(), [])
+        finally:
+            storage.close()
@@ -1,7 +1,15 @@
 import unittest
 import tempfile
+import multiprocessing
 import os
-from day_11.todo.storage import Storage
+from day_11.todo.storage import ConflictError, CorruptStorageError, JournalStorage, Storage
+from day_11.todo.task_manager import TaskManager
+
+def _add_tasks(filename, journal, count):
+    storage = JournalStorage(filename, compact_threshold=2048) if journal else Storage(filename)
+    manager = TaskManager(storage)
+    for i in range(count):
+        manager.add_task("task %d from %d" % (i, os.getpid()))
 
 class TestStorage(unittest.TestCase):
     def setUp(self):
@@ -13,14 +21,64 @@ class TestStorage(unittest.TestCase):
             f.write('[]')
 
     def tearDown(self):
-        try:
-            os.unlink(self.filename)
-        except Exception:
-            pass
+        for path in (self.filename, self.filename + ".lock", self.filename + ".journal",
+                     self.filename + ".journal.compacting"):
+            try:
+                os.unlink(path)
+            except Exception:
+                pass
 
     def test_save_and_load(self):
         s = Storage(self.filename)
         data = [{"id": "1", "description": "a"}]
         s.save(data)
         loaded = s.load()
-        self.assertEqual(loaded, data)
\ No newline at end of file
+        self.assertEqual(loaded, data)
+
+    def test_save_bumps_generation(self):
+        s = Storage(self.filename)
+        s.load()
+        s.save([])
+        s.save([{"id": "1", "description": "a"}])
+        self.assertEqual(s.generation, 2)
+        other = Storage(self.filename)
+        self.assertEqual(other.load(), [{"id": "1", "description": "a"}])
+        self.assertEqual(other.generation, 2)
+
+    def test_stale_writer_conflicts(self):
+        s1 = Storage(self.filename)
+        s2 = Storage(self.filename)
+        s1.load()
+        s2.load()
+        s1.save([{"id": "1", "description": "a"}])
+        with self.assertRaises(ConflictError):
+            s2.save([{"id": "2", "description": "b"}])
+        self.assertEqual(Storage(self.filename).load(), [{"id": "1", "description": "a"}])
+
+    def test_corrupt_file_is_not_overwritten(self):
+        manager = TaskManager(Storage(self.filename))
+        for i in range(3):
+            manager.add_task("task %d" % i)
+        with open(self.filename, "r+", encoding="utf-8") as f:
+            f.truncate(40)
+        with open(self.filename, encoding="utf-8") as f:
+            damaged = f.read()
+        with self.assertRaises(CorruptStorageError):
+            TaskManager(Storage(self.filename))
+        with open(self.filename, encoding="utf-8") as f:
+            self.assertEqual(f.read(), damaged)
+
+    def test_concurrent_processes_lose_nothing(self):
+        for journal in (False, True):
+            with self.subTest(journal=journal):
+                with open(self.filename, 'w') as f:
+                    f.write('[]')
+                procs = [multiprocessing.Process(target=_add_tasks, args=(self.filename, journal, 20))
+                         for _ in range(4)]
+                for p in procs:
+                    p.start()
+                for p in procs:
+                    p.join()
+                    self.assertEqual(p.exitcode, 0)
+                storage = JournalStorage(self.filename) if journal else Storage(self.filename)
+                self.assertEqual(len(TaskManager(storage).get_all_tasks()), 80)
@@ -13,4 +13,12 @@ class TestTask(unittest.TestCase):
 
     def test_empty_description_raises(self):
         with self.assertRaises(ValueError):
-            Task.create("")
\ No newline at end of file
+            Task.create("")
+
+    def test_slots_and_equality(self):
+        t = Task("1", "a", created_at="2025-01-01T00:00:00")
+        self.assertFalse(hasattr(t, "__dict__"))
+        self.assertEqual(t, Task.from_dict(t.to_dict()))
+        self.assertNotEqual(t, Task("1", "b", created_at="2025-01-01T00:00:00"))
+        self.assertEqual(t.to_dict(), {"id": "1", "description": "a", "completed": False,
+                                       "created_at": "2025-01-01T00:00:00"})
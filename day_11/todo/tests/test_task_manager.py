@@ -40,4 +40,104 @@ class TestTaskManager(unittest.TestCase):
 
     def test_nonexistent_operations(self):
         self.assertFalse(self.manager.mark_completed("no-id"))
-        self.assertFalse(self.manager.delete_task("no-id"))
\ No newline at end of file
+        self.assertFalse(self.manager.delete_task("no-id"))
+
+    def assertIndexesConsistent(self):
+        tasks = self.manager.get_all_tasks()
+        self.assertEqual(self.manager._by_id, {t.id: t for t in tasks})
+        for flag in (False, True):
+            self.assertEqual(
+                {t.id for t in self.manager.get_tasks_by_status(flag)},
+                {t.id for t in tasks if t.completed == flag},
+            )
+        self.assertEqual(
+            [t.id for t in self.manager.get_tasks_by_created()],
+            [t.id for t in sorted(tasks, key=lambda t: (t.created_at, t.id))],
+        )
+
+    def test_id_index_consistent(self):
+        ids = [self.manager.add_task("t%d" % i).id for i in range(5)]
+        self.manager.delete_task(ids[1])
+        self.assertIndexesConsistent()
+        self.assertIs(self.manager.find_task(ids[0]), self.manager.get_all_tasks()[0])
+        self.assertIsNone(self.manager.find_task(ids[1]))
+
+    def test_status_index_consistent(self):
+        ids = [self.manager.add_task("t%d" % i).id for i in range(4)]
+        self.manager.mark_completed(ids[0])
+        self.manager.mark_completed(ids[2])
+        self.manager.mark_completed(ids[2])
+        self.manager.delete_task(ids[0])
+        self.assertIndexesConsistent()
+        self.assertEqual([t.id for t in self.manager.get_tasks_by_status(True)], [ids[2]])
+
+    def test_created_index_consistent(self):
+        with open(self.filename, 'w') as f:
+            f.write('[{"id": "b", "description": "b", "created_at": "2025-01-02T00:00:00"},'
+                    ' {"id": "a", "description": "a", "created_at": "2025-01-01T00:00:00"}]')
+        self.manager = TaskManager(self.storage)
+        self.manager.add_task("c")
+        self.manager.delete_task("b")
+        self.assertIndexesConsistent()
+        self.assertEqual(self.manager.get_tasks_by_created(reverse=True)[-1].id, "a")
+
+    def test_indexes_rebuilt_on_load(self):
+        t = self.manager.add_task("persisted")
+        self.manager.mark_completed(t.id)
+        self.manager = TaskManager(self.storage)
+        self.assertIndexesConsistent()
+        self.assertEqual(self.manager.get_tasks_by_status(True)[0].id, t.id)
+
+    def test_batch_saves_once(self):
+        saves = []
+        original = self.storage.save
+        self.storage.save = lambda tasks: (saves.append(len(tasks)), original(tasks))
+        with self.manager.batch():
+            ids = [self.manager.add_task("t%d" % i).id for i in range(10)]
+            self.manager.mark_completed(ids[0])
+            self.manager.delete_task(ids[1])
+        self.assertEqual(saves, [9])
+        self.assertIndexesConsistent()
+
+    def test_batch_discarded_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.manager.batch():
+                self.manager.add_task("lost")
+                raise RuntimeError("boom")
+        self.assertEqual(TaskManager(self.storage).get_all_tasks(), [])
+        # The failed batch must not ride along with the next save
+        self.assertEqual(self.manager.get_all_tasks(), [])
+        self.manager.add_task("later")
+        self.assertIndexesConsistent()
+        self.assertEqual([t.description for t in TaskManager(self.storage).get_all_tasks()], ["later"])
+
+    def test_import_and_bulk_operations(self):
+        count = self.manager.import_tasks([
+            {"id": "a", "description": "imported", "completed": True, "created_at": "2025-01-01T00:00:00"},
+            {"description": "new one"},
+        ])
+        self.assertEqual(count, 2)
+        self.assertTrue(self.manager.find_task("a").completed)
+        new_id = self.manager.get_all_tasks()[1].id
+        self.assertEqual(self.manager.complete_tasks([new_id, "missing"]), 1)
+        self.assertEqual(self.manager.delete_tasks(["a", "missing"]), 1)
+        self.assertIndexesConsistent()
+        reloaded = TaskManager(self.storage)
+        self.assertEqual([t.id for t in reloaded.get_all_tasks()], [new_id])
+        self.assertTrue(reloaded.find_task(new_id).completed)
+
+    def test_conflicting_writers_merge(self):
+        other = TaskManager(Storage(self.filename))
+        t1 = self.manager.add_task("first")
+        t2 = other.add_task("second")
+        other.mark_completed(t1.id)
+        ids = [t.id for t in TaskManager(Storage(self.filename)).get_all_tasks()]
+        self.assertEqual(ids, [t1.id, t2.id])
+        self.assertTrue(other.find_task(t1.id).completed)
+        # self.manager is now stale; its next save picks up the other writer's changes
+        t3 = self.manager.add_task("third")
+        self.assertTrue(self.manager.find_task(t1.id).completed)
+        self.manager.delete_task(t2.id)
+        reloaded = TaskManager(Storage(self.filename))
+        self.assertEqual([t.id for t in reloaded.get_all_tasks()], [t1.id, t3.id])
+        self.assertTrue(reloaded.find_task(t1.id).completed)
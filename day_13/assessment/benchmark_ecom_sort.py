@@ -0,0 +1,65 @@
+"""Benchmark the ecom_sort engines on synthetic orders.
+
+    python benchmark_ecom_sort.py --count 1000000
+
+bubble_sort is O(n^2), so it only runs on the first --bubble-count orders.
+"""
+import argparse
+import datetime
+import random
+import time
+
+import ecom_sort
+from ecom_sort import (ORDER_STATUS, bubble_sort, merge_sort, sort_by_amount, sort_by_column,
+                       sort_by_date, sort_by_status, timsort, top_five_orders)
+
+
+def make_orders(count, seed):
+    rng = random.Random(seed)
+    start = datetime.date(2020, 1, 1)
+    statuses = list(ORDER_STATUS)
+    return [
+        {
+            "order_id": 1000 + i,
+            "customer_name": f"customer-{rng.randrange(100000)}",
+            "total_amount": round(rng.uniform(1, 5000), 2),
+            "order_date": (start + datetime.timedelta(days=rng.randrange(2000))).isoformat(),
+            "delivery_status": rng.choice(statuses),
+        }
+        for i in range(count)
+    ]
+
+
+def timed(label, fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    print(f"  {label:<36}{time.perf_counter() - start:>10.3f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--bubble-count", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    orders = make_orders(args.count, args.seed)
+    amount = lambda x: x["total_amount"]
+    print(f"{args.count} orders (NumPy {'available' if ecom_sort.np is not None else 'not installed'})")
+    timed("sort_by_amount", sort_by_amount, orders)
+    timed("sort_by_date", sort_by_date, orders)
+    timed("sort_by_status", sort_by_status, orders)
+    timed("top_five_orders", top_five_orders, orders)
+    timed("timsort(total_amount)", timsort, orders, amount)
+    timed("merge_sort(total_amount)", merge_sort, orders, amount)
+    timed("sort_by_column(total_amount)", sort_by_column, orders, "total_amount")
+
+    small = orders[: args.bubble_count]
+    print(f"{len(small)} orders")
+    timed("bubble_sort(total_amount)", bubble_sort, small, amount)
+    timed("merge_sort(total_amount)", merge_sort, small, amount)
+    timed("timsort(total_amount)", timsort, small, amount)
+
+
+if __name__ == "__main__":
+    main()
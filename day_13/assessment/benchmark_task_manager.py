@@ -0,0 +1,62 @@
+"""Benchmark the linked-list TaskManager against IndexedTaskManager.
+
+    python benchmark_task_manager.py --sizes 1000 10000 100000
+
+The original TaskManager walks the whole list on every add, so building it is
+O(N^2); sizes above --legacy-max are skipped for it.
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from task_manager import IndexedTaskManager, TaskManager
+
+PRIORITIES = ["High", "Medium", "Low"]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(cls, n, ops, rng):
+    names = [f"task-{i}" for i in range(n)]
+    picks = rng.sample(names, min(ops, n))
+    manager = cls()
+    results = {}
+    # The managers print on every call; keep that out of the terminal
+    with contextlib.redirect_stdout(io.StringIO()):
+        results["add"] = timed(lambda: [manager.add_task(name, rng.choice(PRIORITIES)) for name in names])
+        results["count_pending"] = timed(lambda: [manager.count_pending() for _ in range(ops)])
+        results["mark_completed"] = timed(lambda: [manager.mark_completed(name) for name in picks])
+        results["delete"] = timed(lambda: [manager.delete_task(name) for name in picks[: ops // 2]])
+        if hasattr(manager, "next_task"):
+            results["next_task"] = timed(lambda: [manager.next_task() for _ in range(ops)])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--ops", type=int, default=1000, help="lookups/updates per operation type")
+    parser.add_argument("--legacy-max", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    columns = ["add", "count_pending", "mark_completed", "delete", "next_task"]
+    print(f"{'engine':<20}{'N':>8}" + "".join(f"{c:>16}" for c in columns) + "   (seconds)")
+    for n in args.sizes:
+        for cls in (TaskManager, IndexedTaskManager):
+            if cls is TaskManager and n > args.legacy_max:
+                print(f"{cls.__name__:<20}{n:>8}   skipped (O(N^2) build, raise --legacy-max to run)")
+                continue
+            results = run(cls, n, args.ops, random.Random(args.seed))
+            cells = "".join(f"{results[c]:>16.4f}" if c in results else f"{'-':>16}" for c in columns)
+            print(f"{cls.__name__:<20}{n:>8}{cells}")
+
+
+if __name__ == "__main__":
+    main()
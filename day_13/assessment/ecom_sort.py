@@ -1,4 +1,10 @@
 # ecommerce_sorting.py
+import heapq
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; numeric sorts fall back to Timsort
+    np = None
 
 orders = [
     {"order_id": 1001, "customer_name": "Alice", "total_amount": 1200.50, "order_date": "2025-10-21", "delivery_status": "Delivered"},
@@ -23,24 +29,82 @@ def bubble_sort(data, key_func, reverse=False):
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
     return arr
 
+# Faster engines. Each computes key_func once per item instead of once per comparison.
+def merge_sort(data, key_func, reverse=False):
+    """Stable bottom-up merge sort over (key, item) pairs (decorate-sort-undecorate)."""
+    arr = [(key_func(item), item) for item in data]
+    n = len(arr)
+    width = 1
+    while width < n:
+        merged = []
+        for lo in range(0, n, 2 * width):
+            left = arr[lo:lo + width]
+            right = arr[lo + width:lo + 2 * width]
+            i = j = 0
+            while i < len(left) and j < len(right):
+                # Ties take from the left run, which keeps the sort stable in both directions
+                if (left[i][0] >= right[j][0]) if reverse else (left[i][0] <= right[j][0]):
+                    merged.append(left[i])
+                    i += 1
+                else:
+                    merged.append(right[j])
+                    j += 1
+            merged.extend(left[i:])
+            merged.extend(right[j:])
+        arr = merged
+        width *= 2
+    return [item for _, item in arr]
+
+
+def timsort(data, key_func, reverse=False):
+    """Python's built-in stable Timsort; sorted() already caches one key per item."""
+    return sorted(data, key=key_func, reverse=reverse)
+
+
+SORT_ENGINES = {"timsort": timsort, "merge": merge_sort, "bubble": bubble_sort}
+DEFAULT_ENGINE = "timsort"
+
+
+def sort_orders(data, key_func, reverse=False, engine=DEFAULT_ENGINE):
+    """Sort with one of SORT_ENGINES."""
+    if engine not in SORT_ENGINES:
+        raise ValueError(f"Unknown sort engine: {engine}")
+    return SORT_ENGINES[engine](data, key_func, reverse=reverse)
+
+
+def sort_by_column(data, column, reverse=False):
+    """Sort on a numeric column with NumPy's stable argsort, or Timsort without NumPy."""
+    if np is None or not data:
+        return timsort(data, lambda x: x[column], reverse=reverse)
+    values = np.fromiter((item[column] for item in data), dtype=np.float64, count=len(data))
+    # Negating keeps equal keys in input order, the same as sorted(..., reverse=True)
+    order = np.argsort(-values if reverse else values, kind="stable")
+    return [data[i] for i in order.tolist()]
+
+
+def top_k(data, k, key_func):
+    """The k largest items, same result as sorting descending and slicing, in O(n log k)."""
+    return heapq.nlargest(k, data, key=key_func)
+
+
 # 2. Sorting cases
 def sort_by_amount(orders):
     #   """Sort by total amount (ascending)."""
-     return bubble_sort(orders, key_func=lambda x: x["total_amount"], reverse=False)
+    return sort_by_column(orders, "total_amount")
 
 def sort_by_date(orders):
     #   """Sort by order date (descending)."""
-    return bubble_sort(orders, key_func=lambda x: x["order_date"], reverse=True)
+    return sort_orders(orders, key_func=lambda x: x["order_date"], reverse=True)
+
+ORDER_STATUS = {"Delivered": 1, "Shipped": 2, "Pending": 3, "Cancelled": 4}
 
 def sort_by_status(orders):
     #   """Sort by delivery status (custom order)."""
-    order_status = {"Delivered": 1, "Shipped": 2, "Pending": 3, "Cancelled": 4}
-    return bubble_sort(orders, key_func=lambda x: order_status[x["delivery_status"]])
+    return sort_orders(orders, key_func=lambda x: ORDER_STATUS[x["delivery_status"]])
 
 # 3. Print Top 5 Orders
 def top_five_orders(orders):
-    sorted_orders = bubble_sort(orders, key_func=lambda x: x["total_amount"], reverse=True)
-    return sorted_orders[:5]
+    return top_k(orders, 5, key_func=lambda x: x["total_amount"])
 
 
 def main():
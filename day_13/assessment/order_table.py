@@ -0,0 +1,211 @@
+"""Columnar order storage with compound and external (on-disk) sorting.
+
+Orders are kept as typed arrays instead of one dict per order:
+order_id (int64), amount (float64), date (int32 days since 1970-01-01) and
+status (int8 code into STATUSES), plus the customer names as a plain list.
+
+Sort keys are column names, prefixed with '-' for descending, e.g.
+["status", "-date", "amount"]. external_sort_csv sorts CSV files that do not
+fit in memory by writing sorted runs to disk and k-way merging them.
+
+    python order_table.py orders.csv sorted.csv --key status --key -date --key amount
+"""
+import argparse
+import csv
+import datetime
+import heapq
+import os
+import tempfile
+from array import array
+
+# Code order is the custom delivery order used by ecom_sort.sort_by_status
+STATUSES = ["Delivered", "Shipped", "Pending", "Cancelled"]
+SORTABLE_COLUMNS = ("order_id", "amount", "date", "status")
+CSV_FIELDS = ["order_id", "customer_name", "total_amount", "order_date", "delivery_status"]
+# Rough in-memory cost of one row: the array slots, the name string and the sort index
+ROW_BYTES = 160
+
+_EPOCH = datetime.date(1970, 1, 1).toordinal()
+
+
+def to_epoch_days(iso_date):
+    return datetime.date.fromisoformat(iso_date).toordinal() - _EPOCH
+
+
+def from_epoch_days(days):
+    return datetime.date.fromordinal(days + _EPOCH).isoformat()
+
+
+def parse_keys(keys):
+    """Turn ["status", "-date"] into [("status", False), ("date", True)]."""
+    parsed = []
+    for key in keys:
+        desc = key.startswith("-")
+        column = key.lstrip("-")
+        if column not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort on {column!r}; choose from {', '.join(SORTABLE_COLUMNS)}")
+        parsed.append((column, desc))
+    return parsed
+
+
+class OrderTable:
+    """Orders stored column by column."""
+
+    def __init__(self):
+        self.order_id = array("q")
+        self.amount = array("d")
+        self.date = array("i")
+        self.status = array("b")
+        self.customer_name = []
+        self.statuses = list(STATUSES)
+        self._status_code = {name: code for code, name in enumerate(self.statuses)}
+
+    def __len__(self):
+        return len(self.order_id)
+
+    def status_code(self, name):
+        code = self._status_code.get(name)
+        if code is None:
+            # Unknown statuses sort after the known ones, in order of first appearance
+            code = len(self.statuses)
+            self.statuses.append(name)
+            self._status_code[name] = code
+        return code
+
+    def append(self, order_id, customer_name, total_amount, order_date, delivery_status):
+        self.order_id.append(int(order_id))
+        self.customer_name.append(customer_name)
+        self.amount.append(float(total_amount))
+        self.date.append(to_epoch_days(order_date))
+        self.status.append(self.status_code(delivery_status))
+
+    @classmethod
+    def from_dicts(cls, orders):
+        table = cls()
+        for o in orders:
+            table.append(o["order_id"], o["customer_name"], o["total_amount"],
+                         o["order_date"], o["delivery_status"])
+        return table
+
+    @classmethod
+    def from_csv(cls, path):
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls.from_dicts(csv.DictReader(f))
+
+    def row(self, i):
+        """Order i as a dict in the same shape as ecom_sort.orders."""
+        return {
+            "order_id": self.order_id[i],
+            "customer_name": self.customer_name[i],
+            "total_amount": self.amount[i],
+            "order_date": from_epoch_days(self.date[i]),
+            "delivery_status": self.statuses[self.status[i]],
+        }
+
+    def to_dicts(self, indices=None):
+        return [self.row(i) for i in (range(len(self)) if indices is None else indices)]
+
+    def argsort(self, keys):
+        """Row indices in compound-key order.
+
+        One stable sort per key, least significant first; Python's sort stays
+        stable with reverse=True, so mixed directions need no key negation.
+        """
+        indices = list(range(len(self)))
+        for column, desc in reversed(parse_keys(keys)):
+            indices.sort(key=getattr(self, column).__getitem__, reverse=desc)
+        return indices
+
+    def take(self, indices):
+        table = OrderTable()
+        table.statuses = list(self.statuses)
+        table._status_code = dict(self._status_code)
+        for column in ("order_id", "amount", "date", "status"):
+            src = getattr(self, column)
+            setattr(table, column, array(src.typecode, [src[i] for i in indices]))
+        table.customer_name = [self.customer_name[i] for i in indices]
+        return table
+
+    def sort(self, keys):
+        return self.take(self.argsort(keys))
+
+    def write_csv(self, f, indices=None):
+        writer = csv.writer(f)
+        for i in (range(len(self)) if indices is None else indices):
+            writer.writerow((self.order_id[i], self.customer_name[i], repr(self.amount[i]),
+                             from_epoch_days(self.date[i]), self.statuses[self.status[i]]))
+
+
+def _merge_key(parsed_keys, status_code):
+    positions = {"order_id": 0, "amount": 2, "date": 3, "status": 4}
+    converters = {"order_id": int, "amount": float, "date": to_epoch_days, "status": status_code}
+
+    def key(row):
+        values = []
+        for column, desc in parsed_keys:
+            v = converters[column](row[positions[column]])
+            values.append(-v if desc else v)
+        return tuple(values)
+    return key
+
+
+def external_sort_csv(src, dst, keys, memory_budget=256 * 1024 * 1024, tmpdir=None):
+    """Sort the orders in CSV file `src` into `dst` using about `memory_budget` bytes.
+
+    Chunks of memory_budget // ROW_BYTES rows are loaded into an OrderTable,
+    sorted and written to temporary run files, which are then k-way merged.
+    Returns the number of runs written (1 means everything fit in memory).
+    """
+    parsed_keys = parse_keys(keys)
+    max_rows = max(1, memory_budget // ROW_BYTES)
+    statuses = OrderTable()  # shared status coding so all runs agree on codes
+    with tempfile.TemporaryDirectory(dir=tmpdir) as workdir:
+        runs = []
+        with open(src, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            while True:
+                table = OrderTable()
+                table.statuses, table._status_code = statuses.statuses, statuses._status_code
+                for row in reader:
+                    table.append(row["order_id"], row["customer_name"], row["total_amount"],
+                                 row["order_date"], row["delivery_status"])
+                    if len(table) >= max_rows:
+                        break
+                if not len(table):
+                    break
+                path = os.path.join(workdir, f"run-{len(runs)}.csv")
+                with open(path, "w", newline="", encoding="utf-8") as out:
+                    table.write_csv(out, table.argsort(keys))
+                runs.append(path)
+                if len(table) < max_rows:
+                    break
+
+        files = [open(path, newline="", encoding="utf-8") for path in runs]
+        try:
+            merged = heapq.merge(*(csv.reader(f) for f in files),
+                                 key=_merge_key(parsed_keys, statuses.status_code))
+            with open(dst, "w", newline="", encoding="utf-8") as out:
+                writer = csv.writer(out)
+                writer.writerow(CSV_FIELDS)
+                writer.writerows(merged)
+        finally:
+            for f in files:
+                f.close()
+    return len(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sort an orders CSV, spilling to disk if needed.")
+    parser.add_argument("src")
+    parser.add_argument("dst")
+    parser.add_argument("--key", action="append", dest="keys",
+                        help="sort column (order_id, amount, date, status); prefix '-' for descending")
+    parser.add_argument("--memory-mb", type=int, default=256)
+    args = parser.parse_args()
+    runs = external_sort_csv(args.src, args.dst, args.keys or ["order_id"],
+                             memory_budget=args.memory_mb * 1024 * 1024)
+    print(f"Sorted {args.src} -> {args.dst} using {runs} run(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,19 @@
+import heapq
+from collections import deque
+
+# Lower rank = more urgent; unknown priorities sort after Low
+PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+
+
 class TaskNode:
     def __init__(self, name, priority):
         self.name = name
         self.priority = priority
         self.status = "Pending"
         self.next = None
+        # Only used by IndexedTaskManager
+        self.prev = None
+        self.deleted = False
 
 
 class TaskManager:
@@ -89,8 +99,116 @@ class TaskManager:
         return count
 
 
+class IndexedTaskManager:
+    """Drop-in replacement for TaskManager that avoids walking the list.
+
+    Keeps a tail pointer and back links so add/delete are O(1), a name -> nodes
+    index so lookups by name are O(1), a running pending count, and a heap
+    keyed on priority so next_task() is O(log N).
+    """
+
+    def __init__(self):
+        self.head = None
+        self.tail = None
+        self._by_name = {}  # name -> nodes with that name, in list order
+        self._pending = 0
+        self._heap = []  # (rank, seq, node); entries for done/deleted nodes are skipped lazily
+        self._seq = 0
+
+    # Add task at the end
+    def add_task(self, name, priority):
+        new_task = TaskNode(name, priority)
+        if self.tail is None:
+            self.head = self.tail = new_task
+        else:
+            new_task.prev = self.tail
+            self.tail.next = new_task
+            self.tail = new_task
+        self._by_name.setdefault(name, deque()).append(new_task)
+        self._pending += 1
+        rank = PRIORITY_RANK.get(str(priority).strip().capitalize(), len(PRIORITY_RANK))
+        heapq.heappush(self._heap, (rank, self._seq, new_task))
+        self._seq += 1
+        print(f"Task '{name}' added successfully!")
+
+    # Display all tasks
+    def display_tasks(self):
+        if self.head is None:
+            print("No tasks available.")
+            return
+
+        curr = self.head
+        print("\n Task List:")
+        while curr:
+            print(f"Task: {curr.name} | Priority: {curr.priority} | Status: {curr.status}")
+            curr = curr.next
+
+    # Delete a task by name (the first one, if names repeat)
+    def delete_task(self, name):
+        if self.head is None:
+            print("No tasks to delete.")
+            return
+
+        nodes = self._by_name.get(name)
+        if not nodes:
+            print(f"Task '{name}' not found.")
+            return
+
+        node = nodes.popleft()
+        if not nodes:
+            del self._by_name[name]
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.deleted = True
+        if node.status == "Pending":
+            self._pending -= 1
+            self._compact_heap()
+        print(f"Task '{name}' deleted successfully!")
+
+    # Mark a task as completed
+    def mark_completed(self, name):
+        nodes = self._by_name.get(name)
+        if not nodes:
+            print(f"Task '{name}' not found.")
+            return
+        node = nodes[0]
+        if node.status == "Completed":
+            print(f"Task '{name}' is already completed!")
+            return
+        node.status = "Completed"
+        self._pending -= 1
+        self._compact_heap()
+        print(f"Task '{name}' marked as completed!")
+
+    # Count pending tasks
+    def count_pending(self):
+        return self._pending
+
+    # Highest-priority pending task (oldest first within a priority), or None
+    def next_task(self):
+        heap = self._heap
+        while heap:
+            node = heap[0][2]
+            if node.status == "Pending" and not node.deleted:
+                return node
+            heapq.heappop(heap)
+        return None
+
+    def _compact_heap(self):
+        # Rebuild once stale entries outnumber live ones so the heap stays O(pending)
+        if len(self._heap) > 2 * self._pending + 16:
+            self._heap = [e for e in self._heap if e[2].status == "Pending" and not e[2].deleted]
+            heapq.heapify(self._heap)
+
+
 if __name__ == "__main__":
-    manager = TaskManager()
+    manager = IndexedTaskManager()
 
     while True:
         print("\n===== TASK MANAGER =====")
@@ -99,7 +217,8 @@ if __name__ == "__main__":
         print("3. Delete Task")
         print("4. Mark Task as Completed")
         print("5. Show Pending Task Count")
-        print("6. Exit")
+        print("6. Show Next Task")
+        print("7. Exit")
 
         choice = input("Enter choice: ")
 
@@ -123,6 +242,13 @@ if __name__ == "__main__":
             print(f"Pending tasks: {manager.count_pending()}")
 
         elif choice == "6":
+            task = manager.next_task()
+            if task:
+                print(f"Next task: {task.name} | Priority: {task.priority}")
+            else:
+                print("No pending tasks.")
+
+        elif choice == "7":
             print("Exiting Task Manager...")
             break
 
@@ -0,0 +1,212 @@
+"""Compare the Huffman codec in huffman_test.py with zlib, bz2 and lzma.
+
+    python benchmark_codecs.py --markdown                        # print a table
+    python benchmark_codecs.py --json results.json --save-baseline codec_baseline.json
+    python benchmark_codecs.py --baseline codec_baseline.json    # exit 1 on ratio regression
+
+Only a worse compression ratio fails the baseline check. Speed is compared
+as a multiple of zlib's speed timed in the same process, so machine-wide
+noise mostly cancels out; slowdowns are warnings unless --strict-speed.
+The corpus is text_generator output (as made by generate_text.py), day_19/heart.csv,
+day_20/advertising.csv and seeded random bytes. Each (codec, sample) pair
+runs in its own process so its peak RSS is not inflated by earlier runs.
+"""
+import argparse
+import bz2
+import io
+import json
+import lzma
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+
+import huffman_test as huff
+import text_generator
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(os.path.dirname(HERE))
+CSV_SAMPLES = [os.path.join(REPO, "day_19", "heart.csv"), os.path.join(REPO, "day_20", "advertising.csv")]
+# The FGK coder is pure Python and runs under 1 MB/s, so it is opt-in
+DEFAULT_CODECS = ["huffman", "zlib", "bz2", "lzma"]
+# Speeds are compared as a fraction of this codec's speed on the same sample
+REFERENCE_CODEC = "zlib"
+COLUMNS = ["sample", "codec", "size_mb", "ratio", "encode_mb_s", "decode_mb_s",
+           "encode_vs_ref", "decode_vs_ref", "peak_rss_mb"]
+
+
+def huffman_compress(data, adaptive=False):
+    # Drop tables cached by earlier repeats so every run pays for its own setup
+    huff._cached_table.cache_clear()
+    out = io.BytesIO()
+    huff.write_container(out, data, adaptive=adaptive)
+    return out.getvalue()
+
+
+def huffman_decompress(data):
+    huff._cached_table.cache_clear()
+    return huff.read_container(data)
+
+
+CODECS = {
+    "huffman": (huffman_compress, huffman_decompress),
+    "huffman-adaptive": (lambda data: huffman_compress(data, adaptive=True), huffman_decompress),
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "bz2": (lambda data: bz2.compress(data, 9), bz2.decompress),
+    "lzma": (lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+
+
+def best_time(fn, arg, min_runs=7, min_seconds=0.5):
+    """Fastest of at least `min_runs` calls, repeating until `min_seconds` have passed."""
+    best = float("inf")
+    runs = 0
+    started = time.perf_counter()
+    while runs < min_runs or time.perf_counter() - started < min_seconds:
+        start = time.perf_counter()
+        result = fn(arg)
+        best = min(best, time.perf_counter() - start)
+        runs += 1
+    return result, best
+
+
+def run_one(codec, path):
+    """Benchmark one codec on one file; runs inside a child process."""
+    compress, decompress = CODECS[codec]
+    with open(path, "rb") as f:
+        data = f.read()
+    packed, encode_s = best_time(compress, data)
+    restored, decode_s = best_time(decompress, packed)
+    if restored != data:
+        raise SystemExit(f"{codec} round trip differs on {path}")
+    mb = len(data) / 1e6
+    # ru_maxrss is in KiB on Linux; read it before the reference codec runs
+    peak_rss_mb = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    # Time the reference codec right after, in this process, so both share the machine's current state
+    ref_compress, ref_decompress = CODECS[REFERENCE_CODEC]
+    ref_packed, ref_encode_s = best_time(ref_compress, data)
+    _, ref_decode_s = best_time(ref_decompress, ref_packed)
+    return {
+        "sample": os.path.basename(path),
+        "codec": codec,
+        "size_mb": round(mb, 3),
+        "ratio": round(len(data) / len(packed), 4),
+        "encode_mb_s": round(mb / encode_s, 2),
+        "decode_mb_s": round(mb / decode_s, 2),
+        "encode_vs_ref": round(ref_encode_s / encode_s, 4),
+        "decode_vs_ref": round(ref_decode_s / decode_s, 4),
+        "peak_rss_mb": peak_rss_mb,
+    }
+
+
+def run_isolated(codec, path):
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--run-one", codec, path],
+                          cwd=HERE, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(proc.stderr.strip() or f"{codec} failed on {path}")
+    return json.loads(proc.stdout)
+
+
+def make_corpus(workdir, text_path, text_mb, random_mb, seed):
+    if not os.path.exists(text_path):
+        text_path = os.path.join(workdir, "large_text.txt")
+        text_generator.write_corpus(text_path, int(text_mb * 1e6), seed=seed)
+    random_path = os.path.join(workdir, "random.bin")
+    with open(random_path, "wb") as f:
+        f.write(random.Random(seed).randbytes(int(random_mb * 1e6)))
+    return [text_path] + [p for p in CSV_SAMPLES if os.path.exists(p)] + [random_path]
+
+
+def markdown_table(results):
+    lines = ["| " + " | ".join(COLUMNS) + " |", "|" + "---|" * len(COLUMNS)]
+    for row in results:
+        lines.append("| " + " | ".join(str(row[c]) for c in COLUMNS) + " |")
+    return "\n".join(lines)
+
+
+def regressions(results, baseline, ratio_tolerance):
+    """Describe every result whose compression ratio is worse than its baseline entry."""
+    previous = {(row["sample"], row["codec"]): row for row in baseline}
+    problems = []
+    for row in results:
+        old = previous.get((row["sample"], row["codec"]))
+        if old is not None and row["ratio"] < old["ratio"] * (1 - ratio_tolerance):
+            problems.append(f"{row['codec']} on {row['sample']}: ratio {row['ratio']} < baseline {old['ratio']}")
+    return problems
+
+
+def slowdowns(results, baseline, speed_tolerance):
+    """Describe speed and peak RSS changes beyond speed_tolerance.
+
+    Speeds are compared as multiples of the reference codec timed in the same
+    process, so a busier or slower machine does not count as a slowdown.
+    """
+    previous = {(row["sample"], row["codec"]): row for row in baseline}
+    problems = []
+    for row in results:
+        old = previous.get((row["sample"], row["codec"]))
+        if old is None:
+            continue
+        label = f"{row['codec']} on {row['sample']}"
+        for key in ("encode_vs_ref", "decode_vs_ref"):
+            if key in old and row[key] < old[key] * (1 - speed_tolerance):
+                problems.append(f"{label}: {key} {row[key]} < baseline {old[key]}")
+        if row["peak_rss_mb"] > old["peak_rss_mb"] * (1 + speed_tolerance):
+            problems.append(f"{label}: peak_rss_mb {row['peak_rss_mb']} > baseline {old['peak_rss_mb']}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--codecs", nargs="+", choices=list(CODECS), default=DEFAULT_CODECS)
+    parser.add_argument("--text", default=os.path.join(HERE, "large_text.txt"),
+                        help="text sample (generated with text_generator into a temp dir if missing)")
+    parser.add_argument("--text-mb", type=float, default=5.0, help="size of the generated text sample")
+    parser.add_argument("--random-mb", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--markdown", action="store_true", help="print a Markdown table instead of JSON")
+    parser.add_argument("--baseline", help="fail if compression ratios regress against this JSON file")
+    parser.add_argument("--save-baseline", help="write results as a new baseline")
+    parser.add_argument("--speed-tolerance", type=float, default=0.25,
+                        help=f"allowed fractional drop in MB/s relative to {REFERENCE_CODEC} (and rise in peak RSS)")
+    parser.add_argument("--strict-speed", action="store_true", help="fail on slowdowns too, not just warn")
+    parser.add_argument("--ratio-tolerance", type=float, default=0.01)
+    parser.add_argument("--run-one", nargs=2, metavar=("CODEC", "FILE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(*args.run_one)))
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus = make_corpus(workdir, args.text, args.text_mb, args.random_mb, args.seed)
+        results = [run_isolated(codec, path) for path in corpus for codec in args.codecs]
+
+    print(markdown_table(results) if args.markdown else json.dumps(results, indent=2))
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        problems = regressions(results, baseline, args.ratio_tolerance)
+        slower = slowdowns(results, baseline, args.speed_tolerance)
+        if args.strict_speed:
+            problems += slower
+        else:
+            for warning in slower:
+                print(f"WARNING: {warning}", file=sys.stderr)
+        for problem in problems:
+            print(f"REGRESSION: {problem}", file=sys.stderr)
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Microbenchmark: NotificationFactory.get_notification calls per second.
+
+    python benchmark_factory.py --calls 200000
+
+Compares the original factory (class dict rebuilt, new instance and an INFO
+log line per call) with the registry-based one. Log output goes to
+os.devnull so the terminal does not slow either side down.
+"""
+import argparse
+import itertools
+import logging
+import os
+import time
+
+from factory_assessment import (EmailNotification, NotificationFactory, PushNotification,
+                                SlackNotification, SMSNotification)
+
+CHANNELS = ["Email", "sms", "PUSH", "Slack"]
+
+
+def legacy_get_notification(channel_type):
+    """The original get_notification, kept for comparison."""
+    channel_type = channel_type.lower()
+    notification_classes = {
+        "email": EmailNotification,
+        "sms": SMSNotification,
+        "push": PushNotification,
+        "slack": SlackNotification,
+    }
+    if channel_type not in notification_classes:
+        raise ValueError(f"Unknown notification type: {channel_type}")
+    selected_class = notification_classes[channel_type]
+    logging.info(f"Factory created instance of {selected_class.__name__}")
+    return selected_class()
+
+
+def calls_per_second(fn, calls):
+    names = list(itertools.islice(itertools.cycle(CHANNELS), calls))
+    start = time.perf_counter()
+    for name in names:
+        fn(name)
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    root = logging.getLogger()
+    devnull = open(os.devnull, "w")
+    root.handlers = [logging.StreamHandler(devnull)]
+    try:
+        before = calls_per_second(legacy_get_notification, args.calls)
+        after = calls_per_second(NotificationFactory.get_notification, args.calls)
+    finally:
+        devnull.close()
+    print(f"  {'original factory':<22}{before:>14,.0f} calls/s")
+    print(f"  {'registry + pool':<22}{after:>14,.0f} calls/s")
+    print(f"  speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Throughput and peak-memory benchmark for the Huffman codec in huffman_test.py.
+
+    python generate_text.py          # creates large_text.txt (~5 MB)
+    python benchmark_huffman.py large_text.txt
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+import huffman_test as huff
+
+
+def measure(fn, *args):
+    """Return (result, seconds, peak traced bytes).
+
+    Timed and memory-traced in separate runs, since tracemalloc slows every allocation.
+    """
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def legacy_encode(text, codebook):
+    return huff.get_byte_array(huff.pad_encoded_text(huff.huffman_encode(text, codebook)))
+
+
+def legacy_decode(data, codebook):
+    """The original per-byte, per-bit string decoder, kept for comparison."""
+    reverse_codebook = {v: k for k, v in codebook.items()}
+    file = io.BytesIO(data)
+    bit_string = ""
+    byte = file.read(1)
+    while byte:
+        bit_string += bin(ord(byte))[2:].rjust(8, '0')
+        byte = file.read(1)
+    actual_text = huff.remove_padding(bit_string)
+    current_code = ""
+    decoded_chars = []
+    for bit in actual_text:
+        current_code += bit
+        if current_code in reverse_codebook:
+            decoded_chars.append(reverse_codebook[current_code])
+            current_code = ""
+    return ''.join(decoded_chars)
+
+
+def table_decode(data, codebook):
+    bit_count = (len(data) - 1) * 8 - data[0]
+    return huff.decode_bits(memoryview(data)[1:], bit_count, huff.build_decode_table(codebook))
+
+
+def report(label, size, elapsed, peak=None):
+    memory = "" if peak is None else f"{peak / 1e6:>12.1f} MB peak"
+    print(f"  {label:<28}{size / elapsed / 1e6:>10.2f} MB/s{memory}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", nargs="?", default="large_text.txt")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processes for the parallel block container runs")
+    parser.add_argument("--legacy-decode", action="store_true",
+                        help="also time the original string decoder (takes minutes on 5 MB)")
+    args = parser.parse_args()
+    if not os.path.exists(args.input):
+        raise SystemExit(f"{args.input} not found; run generate_text.py first")
+
+    with open(args.input, "r", encoding="utf-8") as f:
+        text = f.read()
+    size = os.path.getsize(args.input)
+    codebook = huff.canonical_codes(huff.generate_codes(huff.build_huffman_tree(text)))
+    code_table = huff.build_code_table(codebook)
+    print(f"{args.input}: {size / 1e6:.1f} MB")
+
+    print("encode")
+    legacy, elapsed, peak = measure(legacy_encode, text, codebook)
+    report("string bits (legacy)", size, elapsed, peak)
+    (packed, _), elapsed, peak = measure(huff.pack_encoded, text, code_table)
+    report("bit accumulator", size, elapsed, peak)
+    if bytes(legacy) != bytes(packed):
+        raise SystemExit("FAIL: bitstreams differ")
+
+    print("decode")
+    data = bytes(packed)
+    decoded, table_s, peak = measure(table_decode, data, codebook)
+    report("lookup table", size, table_s, peak)
+    if decoded != text:
+        raise SystemExit("FAIL: round trip differs")
+    if args.legacy_decode:
+        decoded, legacy_s, peak = measure(legacy_decode, data, codebook)
+        report("string bits (legacy)", size, legacy_s, peak)
+        print(f"  speedup: {legacy_s / table_s:.0f}x")
+
+    print("block container (compress_file / decompress_file)")
+    with tempfile.TemporaryDirectory() as tmp:
+        packed_path = os.path.join(tmp, "packed.huf")
+        out_path = os.path.join(tmp, "out.txt")
+        for workers in sorted({1, args.workers}):
+            start = time.perf_counter()
+            huff.compress_file(args.input, packed_path, workers=workers)
+            report(f"compress, {workers} worker(s)", size, time.perf_counter() - start)
+            start = time.perf_counter()
+            huff.decompress_file(packed_path, out_path, workers=workers)
+            report(f"decompress, {workers} worker(s)", size, time.perf_counter() - start)
+            if not huff.compare_files(args.input, out_path):
+                raise SystemExit("FAIL: block container round trip differs")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from importlib.metadata import entry_points
+import functools
 import logging
+import threading
 
 
 # Logging Setup
@@ -12,69 +15,138 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 class Notification(ABC):
     """Abstract base class defining the notification interface."""
 
+    # Set to True on stateless, thread-safe channels so the factory shares one instance
+    pooled = False
+
     @abstractmethod
     def notify_user(self, message: str):
         """Send notification with a given message."""
         pass
 
+    def notify_many(self, batch):
+        """Send a batch of (user, message) pairs.
+
+        The default sends each message with notify_user; channels with a bulk
+        API override this (it may also be a coroutine function).
+        """
+        for _user, message in batch:
+            self.notify_user(message)
+
+
+# Factory Class
+
+class NotificationFactory:
+    """Factory class to create appropriate Notification objects.
+
+    Channel classes register themselves under a name with the register
+    decorator, or from installed packages through the "notification_channels"
+    entry point group. Channels that opt in with pooled = True are created
+    once and reused; every other channel gets a new instance per call.
+    """
+
+    ENTRY_POINT_GROUP = "notification_channels"
+    _registry = {}
+    _instances = {}
+    _plugins_loaded = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, channel_type: str):
+        """Class decorator registering a Notification subclass under `channel_type`."""
+        def decorator(notification_class):
+            with cls._lock:
+                cls._registry[channel_type.lower()] = notification_class
+                cls._instances.clear()
+                cls._resolve.cache_clear()
+            return notification_class
+        return decorator
+
+    @classmethod
+    def load_plugins(cls):
+        """Register channels advertised by installed packages' entry points."""
+        for entry_point in entry_points(group=cls.ENTRY_POINT_GROUP):
+            cls.register(entry_point.name)(entry_point.load())
+        cls._plugins_loaded = True
+
+    @classmethod
+    def available(cls):
+        return sorted(cls._registry)
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _resolve(cls, channel_type: str):
+        # Memoized per spelling, so hot loops skip lower() and the dict lookup
+        name = channel_type.lower()
+        if name not in cls._registry and not cls._plugins_loaded:
+            cls.load_plugins()
+        if name not in cls._registry:
+            raise ValueError(f"Unknown notification type: {channel_type}")
+        return name, cls._registry[name]
+
+    @classmethod
+    def get_notification(cls, channel_type: str) -> Notification:
+        """Return an instance of the requested notification type.
+
+        Pooled channels always return the same instance; others get a new one.
+        """
+        name, selected_class = cls._resolve(channel_type)
+        if not selected_class.pooled:
+            return selected_class()
+        instance = cls._instances.get(name)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(name)
+                if instance is None:
+                    instance = cls._instances[name] = selected_class()
+                    logging.debug(f"Factory created instance of {selected_class.__name__}")
+        return instance
+
+
 
 # Concrete Classes
 
+@NotificationFactory.register("email")
 class EmailNotification(Notification):
     """Handles email-based notifications."""
 
+    pooled = True
+
     def notify_user(self, message: str):
         print(f"Sending EMAIL: {message}")
 
 
+@NotificationFactory.register("sms")
 class SMSNotification(Notification):
     """Handles SMS-based notifications."""
 
+    pooled = True
+
     def notify_user(self, message: str):
         print(f"Sending SMS: {message}")
 
 
+@NotificationFactory.register("push")
 class PushNotification(Notification):
     """Handles push-based notifications."""
 
+    pooled = True
+
     def notify_user(self, message: str):
         print(f"Sending PUSH Notification: {message}")
 
 
 # Extendable New Type
+@NotificationFactory.register("slack")
 class SlackNotification(Notification):
     """Handles Slack-based notifications."""
 
+    pooled = True
+
     def notify_user(self, message: str):
         print(f"Sending SLACK message: {message}")
 
 
 
-# Factory Class
-
-class NotificationFactory:
-    """Factory class to create appropriate Notification objects."""
-
-    @staticmethod
-    def get_notification(channel_type: str) -> Notification:
-        """Return an instance of the requested notification type."""
-        channel_type = channel_type.lower()
-        notification_classes = {
-            "email": EmailNotification,
-            "sms": SMSNotification,
-            "push": PushNotification,
-            "slack": SlackNotification,  
-        }
-
-        if channel_type not in notification_classes:
-            raise ValueError(f"Unknown notification type: {channel_type}")
-
-        selected_class = notification_classes[channel_type]
-        logging.info(f"Factory created instance of {selected_class.__name__}")
-        return selected_class()
-
-
-
 #  Main Function
 
 def main():
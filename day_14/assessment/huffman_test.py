@@ -1,6 +1,16 @@
+import argparse
+import contextlib
+import functools
+import hashlib
 import heapq
+import io
+import mmap
 import os
-from collections import Counter, namedtuple
+import struct
+import sys
+import zlib
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
 # Define a simple Node class for Huffman Tree
 class Node(namedtuple("Node", ["char", "freq", "left", "right"])):
@@ -28,16 +38,81 @@ def generate_codes(node, prefix="", codebook=None):
     if node is None:
         return codebook
     if node.char is not None:
-        codebook[node.char] = prefix
+        # A lone root leaf still needs a one-bit code
+        codebook[node.char] = prefix or "0"
     generate_codes(node.left, prefix + "0", codebook)
     generate_codes(node.right, prefix + "1", codebook)
     return codebook
 
 
+def canonical_codes(codebook):
+    """Canonical Huffman code with the same code lengths as `codebook`.
+
+    Symbols are ordered by (length, symbol) and given consecutive codes, so
+    the lengths alone are enough to rebuild the code.
+    """
+    codes = {}
+    code = 0
+    prev_len = 0
+    for length, sym in sorted((len(c), s) for s, c in codebook.items()):
+        code <<= length - prev_len
+        codes[sym] = format(code, f"0{length}b")
+        code += 1
+        prev_len = length
+    return codes
+
+
 def huffman_encode(text, codebook):
     return "".join(codebook[ch] for ch in text)
 
 
+def build_code_table(codebook):
+    """Integer form of a codebook: symbol -> (code bits as an int, code length)."""
+    return {sym: (int(code, 2), len(code)) for sym, code in codebook.items()}
+
+
+def encode_to_bytes(symbols, code_table, out=None):
+    """Huffman-encode straight into a bytearray with an integer bit accumulator.
+
+    Produces the same bits as huffman_encode without building a '0'/'1'
+    string. The final byte is zero padded. Returns (out, bit_count).
+    """
+    if out is None:
+        out = bytearray()
+    acc = 0
+    nbits = 0
+    total = 0
+    for code, length in map(code_table.__getitem__, symbols):
+        acc = (acc << length) | code
+        nbits += length
+        if nbits >= 64:
+            # Flush whole 64-bit words; keeps acc small so the shifts stay cheap
+            nbits -= 64
+            out += (acc >> nbits).to_bytes(8, "big")
+            acc &= (1 << nbits) - 1
+            total += 64
+    total += nbits
+    if nbits:
+        nbytes = (nbits + 7) // 8
+        out += (acc << (nbytes * 8 - nbits)).to_bytes(nbytes, "big")
+    return out, total
+
+
+def pack_encoded(symbols, code_table):
+    """Same bytes as get_byte_array(pad_encoded_text(huffman_encode(...))).
+
+    Returns (byte_array, bit_count).
+    """
+    out = bytearray(1)
+    out, bit_count = encode_to_bytes(symbols, code_table, out)
+    extra_padding = 8 - bit_count % 8
+    out[0] = extra_padding
+    if extra_padding == 8:
+        # pad_encoded_text always pads, so a whole-byte stream gets a full zero byte
+        out.append(0)
+    return out, bit_count
+
+
 def pad_encoded_text(encoded_text):
     extra_padding = 8 - len(encoded_text) % 8
     for _ in range(extra_padding):
@@ -57,20 +132,18 @@ def get_byte_array(padded_encoded_text):
 
 
 def compress(input_file, output_file):
-    with open(input_file, 'r', encoding='utf-8') as file:
+    with open(input_file, 'r', encoding='utf-8', newline='') as file:
         text = file.read()
 
     huffman_tree = build_huffman_tree(text)
-    codebook = generate_codes(huffman_tree)
-    encoded_text = huffman_encode(text, codebook)
-    padded_encoded_text = pad_encoded_text(encoded_text)
-    byte_array = get_byte_array(padded_encoded_text)
+    codebook = canonical_codes(generate_codes(huffman_tree))
+    byte_array, encoded_bits = pack_encoded(text, build_code_table(codebook))
 
     with open(output_file, 'wb') as output:
-        output.write(bytes(byte_array))
+        output.write(byte_array)
 
     print(f" Compression complete: {input_file} → {output_file}")
-    return codebook, len(encoded_text), len(byte_array) * 8
+    return codebook, encoded_bits, len(byte_array) * 8
 
 
 def remove_padding(padded_encoded_text):
@@ -80,30 +153,124 @@ def remove_padding(padded_encoded_text):
     return encoded_text[:-extra_padding]
 
 
-def decompress(input_file, output_file, codebook):
-    reverse_codebook = {v: k for k, v in codebook.items()}
+def build_decode_table(codebook, table_bits=16):
+    """Lookup tables for decoding `table_bits` bits at a time.
+
+    Returns (table, reverse, table_bits, empty). table[w] is (symbols, bits used)
+    for every complete code at the front of the window w, so one lookup can
+    emit several symbols. It is None when the first code is longer than the
+    window. reverse maps (length, code) -> symbol for those long codes and
+    for the stream tail. Integer (byte) symbols decode to bytes, others to
+    str; empty is the matching empty value.
+    """
+    if not codebook:
+        # Only an empty input has no codes; there is nothing to decode
+        return [None, None], {}, 1, ""
+    pieces = {s: bytes((s,)) if isinstance(s, int) else s for s in codebook}
+    reverse = {(len(c), int(c, 2)): pieces[s] for s, c in codebook.items()}
+    max_len = max(len(c) for c in codebook.values())
+    table_bits = max(1, min(table_bits, max_len * 4))
+
+    # first[w]: the code at the front of a first_bits-wide window, if it fits
+    first_bits = min(max_len, table_bits)
+    first = [None] * (1 << first_bits)
+    for (length, code), piece in reverse.items():
+        if length <= first_bits:
+            span = 1 << (first_bits - length)
+            first[code * span:(code + 1) * span] = [(piece, length)] * span
+
+    # levels[k][w] decodes a k-bit window: its first code plus levels[k - length] of the rest
+    empty = next(iter(pieces.values()))[:0]
+    levels = [[(empty, 0)]]
+    for k in range(1, table_bits + 1):
+        level = []
+        shift = first_bits - k
+        for window in range(1 << k):
+            f = first[window << shift] if shift >= 0 else first[window >> -shift]
+            if f is None or f[1] > k:
+                level.append(levels[0][0])
+                continue
+            piece, length = f
+            rest, used = levels[k - length][window & ((1 << (k - length)) - 1)]
+            level.append((piece + rest, length + used))
+        levels.append(level)
+    table = [entry if entry[1] else None for entry in levels[table_bits]]
+    return table, reverse, table_bits, empty
+
+
+def decode_bits(data, bit_count, decode_table, symbol_count=None):
+    """Decode the first `bit_count` bits of `data` (bytes) with build_decode_table output.
+
+    With `symbol_count`, trailing padding bits are allowed and the result is
+    cut to that many symbols.
+    """
+    table, reverse, table_bits, empty = decode_table
+    mask = (1 << table_bits) - 1
+    out = []
+    acc = 0
+    nbits = 0
+    pos = 0
+    remaining = bit_count
+
+    def next_symbol():
+        # Bit-at-a-time fallback for long codes and the last few bits
+        nonlocal acc, nbits, pos, remaining
+        code = length = 0
+        while True:
+            if nbits == 0:
+                acc = data[pos]
+                pos += 1
+                nbits = 8
+            nbits -= 1
+            code = (code << 1) | ((acc >> nbits) & 1)
+            length += 1
+            remaining -= 1
+            sym = reverse.get((length, code))
+            if sym is not None:
+                acc &= (1 << nbits) - 1
+                return sym
+            if remaining <= 0:
+                raise ValueError("Encoded data ends mid-code")
+
+    append = out.append
+    while remaining >= table_bits:
+        if nbits < table_bits:
+            chunk = data[pos:pos + 32]
+            pos += len(chunk)
+            acc = ((acc & ((1 << nbits) - 1)) << (8 * len(chunk))) | int.from_bytes(chunk, "big")
+            nbits += 8 * len(chunk)
+        entry = table[(acc >> (nbits - table_bits)) & mask]
+        if entry is None:
+            append(next_symbol())
+        else:
+            symbols, used = entry
+            append(symbols)
+            nbits -= used
+            remaining -= used
+    acc &= (1 << nbits) - 1
+    try:
+        while remaining > 0:
+            out.append(next_symbol())
+    except ValueError:
+        if symbol_count is None:
+            raise
+    decoded = empty.join(out)
+    if symbol_count is not None:
+        if len(decoded) < symbol_count:
+            raise ValueError(f"Expected {symbol_count} symbols, decoded {len(decoded)}")
+        decoded = decoded[:symbol_count]
+    return decoded
 
+
+def decompress(input_file, output_file, codebook):
     with open(input_file, 'rb') as file:
-        bit_string = ""
-        byte = file.read(1)
-        while byte:
-            bits = bin(ord(byte))[2:].rjust(8, '0')
-            bit_string += bits
-            byte = file.read(1)
-
-    actual_text = remove_padding(bit_string)
-
-    current_code = ""
-    decoded_chars = []  # Use a list (faster than string concatenation)
-    for bit in actual_text:
-        current_code += bit
-        if current_code in reverse_codebook:
-            decoded_chars.append(reverse_codebook[current_code])
-            current_code = ""
-
-    decoded_text = ''.join(decoded_chars)  # Join once at the end
-
-    with open(output_file, 'w', encoding='utf-8') as output:
+        data = file.read()
+
+    # First byte is the number of zero bits padded onto the end
+    bit_count = (len(data) - 1) * 8 - data[0]
+    decoded_text = decode_bits(memoryview(data)[1:], bit_count, build_decode_table(codebook))
+
+    with open(output_file, 'w', encoding='utf-8', newline='') as output:
         output.write(decoded_text)
 
     print(f"✅ Decompression complete: {input_file} → {output_file}")
@@ -111,16 +278,589 @@ def decompress(input_file, output_file, codebook):
 
 
 def compare_files(file1, file2):
-    """Compare two text files for integrity."""
-    with open(file1, 'r', encoding='utf-8') as f1, open(file2, 'r', encoding='utf-8') as f2:
-        return f1.read() == f2.read()
+    """Compare two files for integrity, byte for byte."""
+    return compare_mapped(file1, file2).first_difference is None
+
+
+Comparison = namedtuple("Comparison", ["first_difference", "digests1", "digests2"])
+
+
+@contextlib.contextmanager
+def mapped(path):
+    """Read-only mmap of `path` (b"" for an empty file, which mmap refuses)."""
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def block_digest(data):
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def first_difference(a, b):
+    """Offset of the first byte where buffers `a` and `b` differ, or None if they are equal.
+
+    Halves the range with slice comparisons, so only the differing block is scanned.
+    """
+    lo, hi = 0, min(len(a), len(b))
+    if a[:hi] == b[:hi]:
+        return None if len(a) == len(b) else hi
+    while hi - lo > 64:
+        mid = (lo + hi) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid
+    return next(i for i in range(lo, hi) if a[i] != b[i])
+
+
+def compare_mapped(file1, file2, block_size=1 << 20):
+    """Compare two files through mmap, block by block, without reading them into memory.
+
+    Returns Comparison(first_difference, digests1, digests2): the offset of the
+    first differing byte (None if the files are identical) and the BLAKE2b
+    digest of every `block_size` block of each file.
+    """
+    digests1, digests2 = [], []
+    first = None
+    with mapped(file1) as data1, mapped(file2) as data2, \
+            memoryview(data1) as view1, memoryview(data2) as view2:
+        for start in range(0, max(len(view1), len(view2)), block_size):
+            with view1[start:start + block_size] as block1, view2[start:start + block_size] as block2:
+                digests1.append(block_digest(block1))
+                digests2.append(block_digest(block2))
+                if first is None and digests1[-1] != digests2[-1]:
+                    first = start + first_difference(block1, block2)
+    return Comparison(first, digests1, digests2)
 
 
 def compression_ratio(original_bits, compressed_bits):
     return original_bits / compressed_bits
 
 
-if __name__ == "__main__":
+class AdaptiveHuffman:
+    """FGK adaptive Huffman model over bytes.
+
+    Encoder and decoder start from the same tree, a lone NYT ("not yet
+    transmitted") node, and update it after every symbol, so no code table is
+    stored and no counting pass is needed. A byte's first occurrence is sent
+    as the NYT code followed by its 8 raw bits.
+
+    Nodes live in parallel lists indexed by their implicit node number: 0 is
+    the root and weights never increase with the index (the sibling property).
+    """
+    __slots__ = ("weight", "parent", "left", "right", "symbol", "leaf", "nyt")
+
+    def __init__(self):
+        self.weight = [0]
+        self.parent = [-1]
+        self.left = [-1]
+        self.right = [-1]
+        self.symbol = [-1]
+        self.leaf = [-1] * 256  # byte -> node index, -1 until first seen
+        self.nyt = 0
+
+    def code(self, node):
+        """(bits, length) of the path from the root to `node`; right is 1."""
+        parent, right = self.parent, self.right
+        code = length = 0
+        while node:
+            up = parent[node]
+            if right[up] == node:
+                code |= 1 << length
+            length += 1
+            node = up
+        return code, length
+
+    def add(self, byte):
+        """Split the NYT node into a new NYT (left) and a leaf for `byte` (right)."""
+        old = self.nyt
+        leaf = len(self.weight)
+        self.weight += (0, 0)
+        self.parent += (old, old)
+        self.left += (-1, -1)
+        self.right += (-1, -1)
+        self.symbol += (byte, -1)
+        self.left[old] = leaf + 1
+        self.right[old] = leaf
+        self.leaf[byte] = leaf
+        self.nyt = leaf + 1
+        return leaf
+
+    def update(self, node):
+        """Add one to the weight of `node` and its ancestors, keeping the sibling property."""
+        weight, parent = self.weight, self.parent
+        while True:
+            w = weight[node]
+            leader = node
+            while leader and weight[leader - 1] == w:
+                leader -= 1
+            if leader != node and leader != parent[node]:
+                self._swap(node, leader)
+                node = leader
+            weight[node] = w + 1
+            if not node:
+                return
+            node = parent[node]
+
+    def _swap(self, a, b):
+        # Equal weights, so only the subtrees hanging off positions a and b trade places
+        left, right, symbol, parent = self.left, self.right, self.symbol, self.parent
+        left[a], left[b] = left[b], left[a]
+        right[a], right[b] = right[b], right[a]
+        symbol[a], symbol[b] = symbol[b], symbol[a]
+        for node in (a, b):
+            if left[node] >= 0:
+                parent[left[node]] = parent[right[node]] = node
+            elif symbol[node] >= 0:
+                self.leaf[symbol[node]] = node
+            else:
+                self.nyt = node
+
+
+def fgk_encode(data):
+    """Adaptive-Huffman encode `data` (bytes) into a zero-padded bytearray."""
+    model = AdaptiveHuffman()
+    leaf, code_of, update = model.leaf, model.code, model.update
+    out = bytearray()
+    acc = 0
+    nbits = 0
+    for byte in data:
+        node = leaf[byte]
+        if node < 0:
+            code, length = code_of(model.nyt)
+            code = (code << 8) | byte
+            length += 8
+            node = model.add(byte)
+        else:
+            code, length = code_of(node)
+        acc = (acc << length) | code
+        nbits += length
+        if nbits >= 64:
+            nbits -= 64
+            out += (acc >> nbits).to_bytes(8, "big")
+            acc &= (1 << nbits) - 1
+        update(node)
+    if nbits:
+        nbytes = (nbits + 7) // 8
+        out += (acc << (nbytes * 8 - nbits)).to_bytes(nbytes, "big")
+    return out
+
+
+def fgk_decode(payload, count):
+    """Decode `count` bytes from an fgk_encode payload."""
+    model = AdaptiveHuffman()
+    left, right, symbol, update = model.left, model.right, model.symbol, model.update
+    out = bytearray()
+    pos = 0
+    try:
+        for _ in range(count):
+            node = 0
+            while left[node] >= 0:
+                bit = (payload[pos >> 3] >> (7 - (pos & 7))) & 1
+                pos += 1
+                node = right[node] if bit else left[node]
+            if node == model.nyt:
+                byte = 0
+                for _ in range(8):
+                    byte = (byte << 1) | ((payload[pos >> 3] >> (7 - (pos & 7))) & 1)
+                    pos += 1
+                node = model.add(byte)
+            out.append(symbol[node])
+            update(node)
+    except IndexError:
+        raise ValueError("Encoded data ends mid-code") from None
+    return bytes(out)
+
+
+# Self-describing containers
+#
+# Both versions start with
+#   magic "HUF1" | version u8 | flags u8 | symbol count u32
+#   symbol count x (symbol u32, code length u8)   canonical code-length table
+#
+# Flags: FLAG_BYTES means symbols are byte values rather than Unicode code
+# points; FLAG_ADAPTIVE means payloads are FGK-coded bytes (see
+# AdaptiveHuffman) and the code-length table is empty.
+#
+# Version 1 (single block, built in memory by write_container):
+#   original length u64 (symbols) | CRC-32 of the original bytes u32
+#   payload: Huffman bits, zero padded to a whole byte
+#
+# Version 2 (streamed blocks, written by compress_file):
+#   block size u32 (symbols per block)
+#   blocks: each one a zero-padded payload that decodes on its own
+#   index: block count x (offset u64, payload bytes u32, symbols u32, CRC-32 u32)
+#   footer: index offset u64 | block count u32 | total symbols u64 | index CRC-32 u32 | "HUFE"
+#
+# All integers are little-endian. Payloads carry no padding byte: the decoder
+# stops after the recorded number of symbols. CRCs cover the UTF-8 encoding
+# of text blocks and the raw bytes of byte blocks.
+
+MAGIC = b"HUF1"
+END_MAGIC = b"HUFE"
+VERSION = 1
+BLOCK_VERSION = 2
+FLAG_BYTES = 1
+FLAG_ADAPTIVE = 2
+MODES = {"text": 0, "bytes": FLAG_BYTES, "adaptive": FLAG_BYTES | FLAG_ADAPTIVE}
+BLOCK_SIZE = 1 << 20  # symbols per block
+READ_CHUNK = 1 << 20  # symbols per read in the streaming passes
+_HEADER = struct.Struct("<4sBBI")
+_LENGTH_ENTRY = struct.Struct("<IB")
+_TRAILER = struct.Struct("<QI")
+_BLOCK_SIZE = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<QIII")
+_FOOTER = struct.Struct("<QIQI4s")
+
+BlockEntry = namedtuple("BlockEntry", ["offset", "size", "symbols", "crc"])
+
+
+def open_source(input_file, flags):
+    """Open a file to compress: text mode for text containers, binary for byte ones."""
+    if flags & FLAG_BYTES:
+        return open(input_file, 'rb')
+    return open(input_file, 'r', encoding='utf-8', newline='')
+
+
+def count_symbols(input_file, chunk_size=READ_CHUNK, flags=0):
+    """Symbol frequencies of a file, counted one chunk at a time."""
+    freq = Counter()
+    with open_source(input_file, flags) as file:
+        for chunk in iter(lambda: file.read(chunk_size), file.read(0)):
+            freq.update(chunk)
+    return freq
+
+
+def pack_header(codebook, version, flags=0):
+    header = bytearray(_HEADER.pack(MAGIC, version, flags, len(codebook)))
+    for sym, code in sorted(codebook.items(), key=lambda item: (len(item[1]), item[0])):
+        header += _LENGTH_ENTRY.pack(sym if flags & FLAG_BYTES else ord(sym), len(code))
+    return header
+
+
+def read_header(file):
+    """Read the common header from `file`. Returns (version, flags, canonical codebook)."""
+    magic, version, flags, nsymbols = _HEADER.unpack(file.read(_HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a Huffman container (bad magic)")
+    if version not in (VERSION, BLOCK_VERSION):
+        raise ValueError(f"Unsupported container version {version}")
+    raw = file.read(nsymbols * _LENGTH_ENTRY.size)
+    to_symbol = int if flags & FLAG_BYTES else chr
+    lengths = {to_symbol(sym): length for sym, length in _LENGTH_ENTRY.iter_unpack(raw)}
+    return version, flags, canonical_codes({sym: "0" * length for sym, length in lengths.items()})
+
+
+def _raw(block):
+    return block if isinstance(block, (bytes, bytearray)) else block.encode("utf-8")
+
+
+def write_container(output, data, adaptive=False):
+    """Encode `data` (str, or bytes for byte mode) as a version 1 container on `output`.
+
+    Returns the number of bytes written.
+    """
+    flags = MODES["adaptive"] if adaptive else MODES["bytes"] if isinstance(data, bytes) else 0
+    codebook = {} if adaptive else canonical_codes(generate_codes(build_huffman_tree(data)))
+    payload, crc = encode_block(data, _cached_table(_model(flags, codebook), False), flags)
+    header = pack_header(codebook, VERSION, flags) + _TRAILER.pack(len(data), crc)
+    output.write(header)
+    output.write(payload)
+    return len(header) + len(payload)
+
+
+def encode_block(block, code_table, flags=0):
+    """Encode one block. Returns (payload bytes, CRC-32 of the block's raw bytes)."""
+    if flags & FLAG_ADAPTIVE:
+        payload = fgk_encode(block)
+    else:
+        payload, _ = encode_to_bytes(block, code_table)
+    return bytes(payload), zlib.crc32(_raw(block))
+
+
+def decode_block(payload, entry, decode_table, flags=0):
+    """Decode one block's payload and check it against its index entry."""
+    if entry.symbols == 0:
+        block = b"" if flags & FLAG_BYTES else ""
+    elif flags & FLAG_ADAPTIVE:
+        block = fgk_decode(payload, entry.symbols)
+    else:
+        block = decode_bits(payload, len(payload) * 8, decode_table, symbol_count=entry.symbols)
+    if zlib.crc32(_raw(block)) != entry.crc:
+        raise ValueError(f"Checksum mismatch in block at offset {entry.offset}: compressed data is corrupt")
+    return block
+
+
+def _model(flags, codebook):
+    return flags, tuple(sorted(codebook.items()))
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_table(model, decode):
+    # Built once per process and model, so pool workers reuse their tables across blocks
+    flags, codebook_items = model
+    codebook = dict(codebook_items)
+    if flags & FLAG_ADAPTIVE:
+        return None
+    if not decode:
+        return build_code_table(codebook)
+    return build_decode_table(codebook) if codebook else None
+
+
+def _encode_job(model, block):
+    payload, crc = encode_block(block, _cached_table(model, False), model[0])
+    return len(block), payload, crc
+
+
+def _decode_job(model, payload, entry):
+    return decode_block(payload, entry, _cached_table(model, True), model[0])
+
+
+def ordered_map(job, model, items, workers=1):
+    """Yield job(model, *item) for each tuple in `items`, in order.
+
+    With workers > 1 the jobs run in a ProcessPoolExecutor with at most
+    2 * workers of them in flight, so memory stays bounded however many
+    blocks there are.
+    """
+    if workers <= 1:
+        for item in items:
+            yield job(model, *item)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(job, model, *item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def resolve_workers(workers, blocks):
+    """0 means one worker per core; never more workers than blocks."""
+    return max(1, min(workers or os.cpu_count() or 1, blocks))
+
+
+def write_blocks(output, chunks, codebook, block_size=BLOCK_SIZE, workers=1, flags=0):
+    """Write a version 2 container to `output`, one block per string (or bytes) in `chunks`.
+
+    Blocks are encoded by `workers` processes (see ordered_map). Only the
+    blocks in flight and the index (20 bytes per block) are held in memory.
+    Returns the number of bytes written.
+    """
+    header = pack_header(codebook, BLOCK_VERSION, flags) + _BLOCK_SIZE.pack(block_size)
+    output.write(header)
+    offset = len(header)
+    index = bytearray()
+    total = 0
+    jobs = ordered_map(_encode_job, _model(flags, codebook), ((c,) for c in chunks), workers)
+    for symbols, payload, crc in jobs:
+        output.write(payload)
+        index += _INDEX_ENTRY.pack(offset, len(payload), symbols, crc)
+        offset += len(payload)
+        total += symbols
+    output.write(index)
+    output.write(_FOOTER.pack(offset, len(index) // _INDEX_ENTRY.size, total, zlib.crc32(index), END_MAGIC))
+    return offset + len(index) + _FOOTER.size
+
+
+def read_block_index(file):
+    """Read a version 2 container's header and index from the seekable `file`.
+
+    Returns (flags, codebook, block_size, [BlockEntry, ...]).
+    """
+    file.seek(0)
+    version, flags, codebook = read_header(file)
+    if version != BLOCK_VERSION:
+        raise ValueError(f"Container version {version} has no block index")
+    (block_size,) = _BLOCK_SIZE.unpack(file.read(_BLOCK_SIZE.size))
+    file.seek(-_FOOTER.size, os.SEEK_END)
+    index_offset, count, _, index_crc, end = _FOOTER.unpack(file.read(_FOOTER.size))
+    if end != END_MAGIC:
+        raise ValueError("Truncated container (missing footer)")
+    file.seek(index_offset)
+    raw = file.read(count * _INDEX_ENTRY.size)
+    if zlib.crc32(raw) != index_crc:
+        raise ValueError("Block index is corrupt")
+    return flags, codebook, block_size, [BlockEntry(*entry) for entry in _INDEX_ENTRY.iter_unpack(raw)]
+
+
+def iter_container(file, workers=1):
+    """Yield the decoded blocks of a container in order (version 1 is one block).
+
+    Blocks are str, or bytes for byte-mode containers. Version 2 blocks are
+    decoded by up to `workers` processes (0 = all cores).
+    """
+    version, flags, codebook = read_header(file)
+    model = _model(flags, codebook)
+    if version == VERSION:
+        original_length, checksum = _TRAILER.unpack(file.read(_TRAILER.size))
+        payload = file.read()
+        entry = BlockEntry(file.tell() - len(payload), len(payload), original_length, checksum)
+        yield decode_block(payload, entry, _cached_table(model, True), flags)
+        return
+    _, _, _, index = read_block_index(file)
+
+    def payloads():
+        for entry in index:
+            file.seek(entry.offset)
+            yield file.read(entry.size), entry
+    yield from ordered_map(_decode_job, model, payloads(), resolve_workers(workers, len(index)))
+
+
+def decompress_block(input_file, block_number):
+    """Decode a single block of a version 2 container without touching the others."""
+    with open(input_file, 'rb') as file:
+        flags, codebook, _, index = read_block_index(file)
+        if not 0 <= block_number < len(index):
+            raise ValueError(f"Block {block_number} out of range; container has {len(index)} blocks")
+        entry = index[block_number]
+        file.seek(entry.offset)
+        return decode_block(file.read(entry.size), entry, _cached_table(_model(flags, codebook), True), flags)
+
+
+def read_container(data):
+    """Decode container bytes back to the original str or bytes, checking the stored CRC-32s."""
+    file = io.BytesIO(data)
+    _, flags, _ = read_header(file)
+    file.seek(0)
+    return (b"" if flags & FLAG_BYTES else "").join(iter_container(file))
+
+
+def compress_file(input_file, output_file, block_size=BLOCK_SIZE, workers=1, mode="text"):
+    """Compress a file into a version 2 container, streaming it a block at a time.
+
+    mode is "text" (UTF-8 characters), "bytes" (any file, 256-symbol
+    alphabet) or "adaptive" (bytes, FGK-coded). The first two count symbols
+    in a first pass; adaptive needs no first pass, at a lower speed. Blocks of
+    `block_size` symbols are encoded on up to `workers` processes (0 = all
+    cores), so memory use does not grow with the file. Returns (input, output) sizes.
+    """
+    flags = MODES[mode]
+    codebook = {}
+    if not flags & FLAG_ADAPTIVE:
+        codebook = canonical_codes(generate_codes(build_huffman_tree(count_symbols(input_file, flags=flags))))
+    size = os.path.getsize(input_file)
+    # A file has at most one symbol per byte, so this bounds the block count
+    workers = resolve_workers(workers, -(-size // block_size))
+    with open_source(input_file, flags) as file, open(output_file, 'wb') as output:
+        chunks = iter(lambda: file.read(block_size), file.read(0))
+        written = write_blocks(output, chunks, codebook, block_size, workers, flags)
+    return size, written
+
+
+def open_output(output_file, flags):
+    if flags & FLAG_BYTES:
+        return open(output_file, 'wb')
+    return open(output_file, 'w', encoding='utf-8', newline='')
+
+
+def decompress_file(input_file, output_file, workers=1):
+    """Decompress a container written by compress_file or write_container; no codebook needed."""
+    with open(input_file, 'rb') as file:
+        _, flags, _ = read_header(file)
+        file.seek(0)
+        with open_output(output_file, flags) as output:
+            for block in iter_container(file, workers):
+                output.write(block)
+
+
+def find_mismatch(compressed_file, original_file, workers=1):
+    """Offset of the first byte where the decoded container differs from `original_file`.
+
+    Returns None when they match. Decoded blocks are checked against a mmap of
+    the original by BLAKE2b digest, so the original is never copied into memory.
+    """
+    with open(compressed_file, 'rb') as file, mapped(original_file) as data, memoryview(data) as view:
+        pos = 0
+        for block in iter_container(file, workers):
+            raw = _raw(block)
+            with view[pos:pos + len(raw)] as expected:
+                if block_digest(raw) != block_digest(expected):
+                    return pos + first_difference(memoryview(raw), expected)
+            pos += len(raw)
+        return None if pos == len(view) else pos
+
+
+def verify_file(compressed_file, original_file=None, workers=1):
+    """Check every block's CRC-32, and that the container decodes to `original_file` if given."""
+    if original_file is not None:
+        return find_mismatch(compressed_file, original_file, workers) is None
+    with open(compressed_file, 'rb') as file:
+        for _ in iter_container(file, workers):
+            pass
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m huffman_test",
+                                     description="Huffman compression with a self-describing file format.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("compress", help="compress a file")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("--mode", choices=list(MODES), default="text",
+                   help="text: UTF-8 characters; bytes: any file; adaptive: bytes, no counting pass")
+    p.add_argument("--block-size", type=int, default=BLOCK_SIZE, help="symbols per independently decodable block")
+    p.add_argument("-j", "--workers", type=int, default=0, help="worker processes (default: one per core)")
+    p = sub.add_parser("decompress", help="decompress a container")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("-j", "--workers", type=int, default=0, help="worker processes (default: one per core)")
+    p.add_argument("--block", type=int, help="decode only this block (numbered from 0)")
+    p = sub.add_parser("verify", help="check a container's checksum (and optionally compare to the original)")
+    p.add_argument("input")
+    p.add_argument("original", nargs="?")
+    p.add_argument("-j", "--workers", type=int, default=0, help="worker processes (default: one per core)")
+    p = sub.add_parser("compare", help="compare two files through mmap and report the first difference")
+    p.add_argument("file1")
+    p.add_argument("file2")
+    p.add_argument("--digests", action="store_true", help="print the BLAKE2b digest of every 1 MiB block")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "compress":
+            original, compressed = compress_file(args.input, args.output, args.block_size, args.workers, args.mode)
+            ratio = original / compressed if compressed else 0
+            print(f"{args.input} -> {args.output}: {original} -> {compressed} bytes ({ratio:.2f}x)")
+        elif args.command == "decompress" and args.block is not None:
+            block = decompress_block(args.input, args.block)
+            with open_output(args.output, MODES["bytes"] if isinstance(block, bytes) else 0) as output:
+                output.write(block)
+            print(f"{args.input} block {args.block} -> {args.output}")
+        elif args.command == "decompress":
+            decompress_file(args.input, args.output, args.workers)
+            print(f"{args.input} -> {args.output}")
+        elif args.command == "compare":
+            result = compare_mapped(args.file1, args.file2)
+            if args.digests:
+                for number, (d1, d2) in enumerate(zip(result.digests1, result.digests2)):
+                    print(f"{number:>8} {d1.hex()} {d2.hex()}{'' if d1 == d2 else '  differs'}")
+            if result.first_difference is not None:
+                print(f"DIFFER: first difference at byte {result.first_difference}")
+                return 1
+            print(f"IDENTICAL: {args.file1} {args.file2}")
+        elif args.original is None:
+            verify_file(args.input, workers=args.workers)
+            print(f"OK: {args.input}")
+        else:
+            mismatch = find_mismatch(args.input, args.original, args.workers)
+            if mismatch is not None:
+                print(f"FAILED: {args.input} differs from {args.original} at byte {mismatch}")
+                return 1
+            print(f"OK: {args.input}")
+    except (OSError, ValueError, struct.error) as err:
+        print(f"Error: {err}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def demo():
     # Step 1: Generate or use an existing text file
     input_file = "large_text.txt"       # You can replace this with your Gutenberg file
     compressed_file = "compressed.bin"
@@ -141,3 +881,10 @@ if __name__ == "__main__":
     # Step 5: Print compression ratio
     ratio = compression_ratio(original_bits, compressed_bits)
     print(f" Compression Ratio: {ratio:.2f} (Original/Compressed)")
+
+
+if __name__ == "__main__":
+    # No arguments runs the original walkthrough; otherwise act as a CLI
+    if len(sys.argv) > 1:
+        sys.exit(main())
+    demo()
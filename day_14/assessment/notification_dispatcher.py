@@ -0,0 +1,188 @@
+"""Asyncio fan-out of (user, channel, message) items to notification channels.
+
+Items are queued per channel and coalesced into batches, which are flushed
+when they reach batch_size or flush_interval seconds after their first
+item. Each channel sends at most max_concurrency batches at once through
+Notification.notify_many. Channel queues are bounded, so submit() waits
+(backpressure) when a channel falls behind.
+
+    python notification_dispatcher.py --count 1000000 --latency 0.01
+"""
+import argparse
+import asyncio
+import inspect
+import logging
+import random
+import time
+from collections import Counter
+
+from factory_assessment import Notification, NotificationFactory
+
+_CLOSE = object()
+
+
+class StubChannel(Notification):
+    """Local stand-in for a real channel: records batches and simulates send latency."""
+
+    pooled = False
+
+    def __init__(self, name="stub", latency=0.0, fail_every=0):
+        self.name = name
+        self.latency = latency
+        self.fail_every = fail_every
+        self.batches = 0
+        self.messages = []
+
+    def notify_user(self, message: str):
+        self.messages.append((None, message))
+
+    async def notify_many(self, batch):
+        await asyncio.sleep(self.latency)
+        self.batches += 1
+        if self.fail_every and self.batches % self.fail_every == 0:
+            raise ConnectionError(f"{self.name}: simulated send failure")
+        self.messages.extend(batch)
+
+
+class NotificationDispatcher:
+    """Batches items per channel and sends them with bounded concurrency.
+
+    channels maps names to Notification instances; names not in it are
+    created once through NotificationFactory. Use as an async context
+    manager, or call close() after the last submit().
+    """
+
+    def __init__(self, channels=None, batch_size=500, flush_interval=0.05,
+                 max_concurrency=4, queue_size=10_000):
+        self.channels = dict(channels or {})
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_concurrency = max_concurrency
+        self.queue_size = queue_size
+        self.sent = Counter()
+        self.failed = Counter()
+        self.batches = Counter()
+        self._queues = {}
+        self._workers = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _channel(self, name):
+        channel = self.channels.get(name)
+        if channel is None:
+            channel = self.channels[name] = NotificationFactory.get_notification(name)
+        return channel
+
+    async def submit(self, user, channel, message):
+        """Queue one message, waiting while that channel's queue is full."""
+        queue = self._queues.get(channel)
+        if queue is None:
+            self._channel(channel)  # fail fast on unknown channels
+            queue = self._queues[channel] = asyncio.Queue(self.queue_size)
+            self._workers.append(asyncio.create_task(self._run_channel(channel, queue)))
+        await queue.put((user, message))
+
+    async def dispatch(self, items):
+        """Submit every (user, channel, message) from a sync or async iterable, then close."""
+        if hasattr(items, "__aiter__"):
+            async for user, channel, message in items:
+                await self.submit(user, channel, message)
+        else:
+            for user, channel, message in items:
+                await self.submit(user, channel, message)
+        await self.close()
+
+    async def close(self):
+        """Flush every channel and wait for all sends to finish."""
+        for queue in self._queues.values():
+            await queue.put(_CLOSE)
+        await asyncio.gather(*self._workers)
+        self._queues.clear()
+        self._workers.clear()
+
+    async def _run_channel(self, name, queue):
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(self.max_concurrency)
+        sending = set()
+        closing = False
+        while not closing:
+            item = await queue.get()
+            if item is _CLOSE:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    # Drain what is already queued without a timer per item
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+            # Waiting here stops the queue from draining, which is what pushes back on submit()
+            await limit.acquire()
+            task = asyncio.create_task(self._send(name, batch, limit))
+            sending.add(task)
+            task.add_done_callback(sending.discard)
+        await asyncio.gather(*sending)
+
+    async def _send(self, name, batch, limit):
+        channel = self.channels[name]
+        try:
+            if inspect.iscoroutinefunction(channel.notify_many):
+                await channel.notify_many(batch)
+            else:
+                await asyncio.to_thread(channel.notify_many, batch)
+            self.sent[name] += len(batch)
+        except Exception as err:
+            self.failed[name] += len(batch)
+            logging.error(f"{name}: batch of {len(batch)} failed: {err}")
+        finally:
+            self.batches[name] += 1
+            limit.release()
+
+
+async def run_campaign(count, channels, **options):
+    """Send `count` generated messages across `channels`; returns the dispatcher."""
+    names = list(channels)
+    rng = random.Random(0)
+    items = ((f"user{i}", rng.choice(names), f"campaign message {i}") for i in range(count))
+    dispatcher = NotificationDispatcher(channels, **options)
+    await dispatcher.dispatch(items)
+    return dispatcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--latency", type=float, default=0.01, help="simulated seconds per batch send")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4, help="batches in flight per channel")
+    args = parser.parse_args()
+
+    channels = {name: StubChannel(name, args.latency) for name in ("email", "sms", "push", "slack")}
+    start = time.perf_counter()
+    dispatcher = asyncio.run(run_campaign(args.count, channels, batch_size=args.batch_size,
+                                          max_concurrency=args.concurrency))
+    elapsed = time.perf_counter() - start
+    total = sum(dispatcher.sent.values())
+    print(f"Sent {total} messages in {sum(dispatcher.batches.values())} batches "
+          f"in {elapsed:.2f} s ({total / elapsed:,.0f} msg/s)")
+    for name, channel in channels.items():
+        print(f"  {name:<6}{dispatcher.sent[name]:>10} sent{channel.batches:>8} batches")
+
+
+if __name__ == "__main__":
+    main()
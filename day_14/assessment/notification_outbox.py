@@ -0,0 +1,377 @@
+"""Durable outbox for notifications, backed by SQLite.
+
+enqueue() commits a message to the outbox table before anything is sent, so
+a crash loses nothing: a message claimed by a worker that died becomes due
+again when its lease runs out. Worker threads claim due messages, send them
+through any Notification channel and record the outcome. Failures are
+retried with exponential backoff and full jitter; after max_attempts the
+message is dead-lettered. Delivery is at-least-once, and an optional
+idempotency key makes enqueueing the same message twice a no-op.
+
+    python notification_outbox.py --count 2000 --workers 4 --failure-rate 0.2
+"""
+import argparse
+import asyncio
+import contextlib
+import inspect
+import logging
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+
+from factory_assessment import Notification, NotificationFactory
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+DEAD = "dead"
+
+# Fixed SQL text so sqlite3's statement cache reuses the prepared statements.
+_CREATE = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    channel TEXT NOT NULL,
+    user TEXT NOT NULL,
+    message TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    sent_at REAL,
+    last_error TEXT
+)
+"""
+_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at)"
+# Only a repeated idempotency key is ignored; other constraint violations raise
+_INSERT = """
+INSERT INTO outbox (idempotency_key, channel, user, message, next_attempt_at, created_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (idempotency_key) DO NOTHING
+"""
+# A claimed message stays 'sending' with next_attempt_at as its lease expiry,
+# so messages held by a crashed worker are picked up again. The attempt is
+# counted at claim time, so a send that hangs or kills its worker still
+# runs out of attempts.
+_SELECT_DUE = """
+SELECT id, channel, user, message, attempts, created_at FROM outbox
+WHERE status IN ('pending', 'sending') AND next_attempt_at <= ?
+ORDER BY next_attempt_at LIMIT ?
+"""
+_CLAIM = "UPDATE outbox SET status = 'sending', attempts = attempts + 1, next_attempt_at = ? WHERE id = ?"
+_MARK_SENT = "UPDATE outbox SET status = 'sent', sent_at = ?, last_error = NULL WHERE id = ?"
+_MARK_RETRY = "UPDATE outbox SET status = 'pending', next_attempt_at = ?, last_error = ? WHERE id = ?"
+_MARK_DEAD = "UPDATE outbox SET status = 'dead', last_error = ? WHERE id = ?"
+_COUNT_BY_STATUS = "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+_SELECT_DEAD = "SELECT id, channel, user, message, attempts, last_error FROM outbox WHERE status = 'dead' ORDER BY id"
+_REQUEUE = "UPDATE outbox SET status = 'pending', attempts = 0, next_attempt_at = ? WHERE id = ? AND status = 'dead'"
+
+
+def backoff_delay(attempts, base=0.5, cap=60.0, rng=random):
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2 ** (attempts - 1))]."""
+    return rng.uniform(0, min(cap, base * 2 ** (attempts - 1)))
+
+
+class Outbox:
+    """SQLite-backed outbox with worker threads, retries and dead-lettering.
+
+    channels maps channel names to Notification instances; other names are
+    resolved through NotificationFactory. Each thread uses its own SQLite
+    connection (WAL mode, so readers never block the writer).
+    """
+
+    def __init__(self, filename="outbox.db", channels=None, max_attempts=5, backoff_base=0.5,
+                 backoff_cap=60.0, lease_seconds=30.0, batch_size=32, poll_interval=0.5):
+        self.filename = filename
+        self.channels = dict(channels or {})
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.lease_seconds = lease_seconds
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._counts = Counter()
+        self._latencies = deque(maxlen=10_000)
+        self._started_at = time.monotonic()
+        conn = self._conn()
+        conn.execute(_CREATE)
+        conn.execute(_CREATE_INDEX)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode; claims open their own transaction
+            conn = self._local.conn = sqlite3.connect(self.filename, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def enqueue(self, channel, user, message, idempotency_key=None):
+        """Durably queue a message. Returns its id, or None if the key was already used."""
+        now = time.time()
+        cursor = self._conn().execute(_INSERT, (idempotency_key, channel.lower(), user, message, now, now))
+        self._wakeup.set()
+        return cursor.lastrowid if cursor.rowcount else None
+
+    def enqueue_many(self, items):
+        """Queue (channel, user, message, idempotency_key) tuples in one transaction.
+
+        Returns how many were new.
+        """
+        now = time.time()
+        conn = self._conn()
+        before = conn.total_changes
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(_INSERT, ((key, channel.lower(), user, message, now, now)
+                                       for channel, user, message, key in items))
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        self._wakeup.set()
+        return conn.total_changes - before
+
+    def claim(self, limit=None):
+        """Lease up to `limit` due messages to the calling thread.
+
+        A message whose lease ran out on its last attempt is dead-lettered
+        instead of being claimed again.
+        """
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = []
+            for row in conn.execute(_SELECT_DUE, (now, limit or self.batch_size)).fetchall():
+                message_id, attempts = row[0], row[4]
+                if attempts >= self.max_attempts:
+                    error = f"lease expired on attempt {attempts}"
+                    conn.execute(_MARK_DEAD, (error, message_id))
+                    self._count(DEAD)
+                    logging.warning(f"Outbox message {message_id} dead-lettered: {error}")
+                    continue
+                conn.execute(_CLAIM, (now + self.lease_seconds, message_id))
+                rows.append(row)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return rows
+
+    def _channel(self, name):
+        channel = self.channels.get(name)
+        if channel is None:
+            channel = NotificationFactory.get_notification(name)
+        return channel
+
+    def deliver(self, row):
+        """Send one claimed message. Returns the (sql, params) status update to record."""
+        message_id, channel_name, user, message, attempts, created_at = row
+        try:
+            channel = self._channel(channel_name)
+        except ValueError as err:
+            # An unknown channel will not appear on retry, so dead-letter it now
+            return self._failed(message_id, self.max_attempts, err)
+        except Exception as err:
+            # e.g. a plugin entry point that failed to import; worth retrying
+            return self._failed(message_id, attempts + 1, err)
+        try:
+            if inspect.iscoroutinefunction(channel.notify_many):
+                # Worker threads have no event loop of their own
+                asyncio.run(channel.notify_many([(user, message)]))
+            else:
+                channel.notify_many([(user, message)])
+        except Exception as err:
+            return self._failed(message_id, attempts + 1, err)
+        sent_at = time.time()
+        with self._lock:
+            self._counts[SENT] += 1
+            self._latencies.append(sent_at - created_at)
+        return _MARK_SENT, (sent_at, message_id)
+
+    def _failed(self, message_id, attempts, err):
+        error = f"{type(err).__name__}: {err}"
+        if attempts >= self.max_attempts:
+            self._count(DEAD)
+            logging.warning(f"Outbox message {message_id} dead-lettered: {error}")
+            return _MARK_DEAD, (error, message_id)
+        self._count("retried")
+        delay = backoff_delay(attempts, self.backoff_base, self.backoff_cap)
+        return _MARK_RETRY, (time.time() + delay, error, message_id)
+
+    def _count(self, key):
+        with self._lock:
+            self._counts[key] += 1
+
+    def run_once(self):
+        """Claim and deliver one batch on the calling thread; returns how many were claimed.
+
+        Outcomes are committed together after the batch, so a crash mid-batch
+        re-sends at most one batch (delivery is at-least-once either way).
+        """
+        rows = self.claim()
+        if rows:
+            updates = [self.deliver(row) for row in rows]
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in updates:
+                    conn.execute(sql, params)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return len(rows)
+
+    def _worker(self):
+        errors = 0
+        while not self._stopping.is_set():
+            try:
+                claimed = self.run_once()
+            except Exception:
+                # e.g. the database stayed locked past busy_timeout. Claimed rows
+                # come due again when their lease runs out, so keep the worker alive.
+                errors += 1
+                logging.exception(f"Outbox worker {threading.current_thread().name} failed; retrying")
+                with contextlib.suppress(sqlite3.Error):
+                    conn = self._conn()
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                self._stopping.wait(backoff_delay(errors, self.poll_interval, self.backoff_cap))
+                continue
+            errors = 0
+            if not claimed:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+
+    def start(self, workers=4):
+        self._stopping.clear()
+        self._started_at = time.monotonic()
+        for i in range(workers):
+            thread = threading.Thread(target=self._worker, name=f"outbox-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Stop the workers after their current batch. Unsent messages stay in the outbox."""
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+    def wait_until_idle(self, timeout=None):
+        """Block until nothing is pending or in flight; returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            counts = self.status_counts()
+            if not counts.get(PENDING) and not counts.get(SENDING):
+                return True
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+
+    def status_counts(self):
+        return dict(self._conn().execute(_COUNT_BY_STATUS).fetchall())
+
+    def dead_letters(self):
+        """(id, channel, user, message, attempts, last_error) for every dead-lettered message."""
+        return self._conn().execute(_SELECT_DEAD).fetchall()
+
+    def requeue(self, message_id):
+        """Give a dead-lettered message a fresh set of attempts."""
+        updated = self._conn().execute(_REQUEUE, (time.time(), message_id)).rowcount
+        self._wakeup.set()
+        return bool(updated)
+
+    def metrics(self):
+        """Counters, queue depth, throughput and delivery latency percentiles (seconds)."""
+        with self._lock:
+            counts = dict(self._counts)
+            latencies = sorted(self._latencies)
+        elapsed = time.monotonic() - self._started_at
+        result = {
+            "sent": counts.get(SENT, 0),
+            "retried": counts.get("retried", 0),
+            "dead_lettered": counts.get(DEAD, 0),
+            "queue_depth": self.status_counts().get(PENDING, 0),
+            "throughput_per_s": counts.get(SENT, 0) / elapsed if elapsed else 0.0,
+        }
+        for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+            result[f"latency_{name}"] = latencies[min(len(latencies) - 1, int(q * len(latencies)))] if latencies else None
+        return result
+
+    def close(self):
+        self.stop()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class FlakyChannel(Notification):
+    """Stub channel that fails a fraction of sends, for exercising retries."""
+
+    pooled = False
+
+    def __init__(self, failure_rate=0.2, latency=0.0, seed=None):
+        self.failure_rate = failure_rate
+        self.latency = latency
+        self.delivered = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def notify_user(self, message: str):
+        self.notify_many([(None, message)])
+
+    def notify_many(self, batch):
+        time.sleep(self.latency)
+        with self._lock:
+            if self._rng.random() < self.failure_rate:
+                raise ConnectionError("simulated transient failure")
+            self.delivered.extend(batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--failure-rate", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.001, help="simulated seconds per send")
+    parser.add_argument("--max-attempts", type=int, default=5)
+    parser.add_argument("--db", help="outbox database (default: a temporary file)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        channel = FlakyChannel(args.failure_rate, args.latency, seed=1)
+        outbox = Outbox(args.db or os.path.join(tmp, "outbox.db"), channels={"email": channel},
+                        max_attempts=args.max_attempts, backoff_base=0.01, backoff_cap=0.2)
+        outbox.enqueue_many(("email", f"user{i}", f"message {i}", f"campaign-1:{i}") for i in range(args.count))
+        duplicates = sum(outbox.enqueue("email", f"user{i}", "again", idempotency_key=f"campaign-1:{i}") is None
+                         for i in range(10))
+        outbox.start(args.workers)
+        outbox.wait_until_idle()
+        metrics = outbox.metrics()
+        outbox.close()
+
+    print(f"Duplicate enqueues ignored: {duplicates}/10")
+    for key, value in metrics.items():
+        print(f"  {key:<18}{value if value is None or isinstance(value, int) else f'{value:.4f}'}")
+
+
+if __name__ == "__main__":
+    main()
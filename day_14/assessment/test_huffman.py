@@ -0,0 +1,39 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import huffman_test as huff
+
+
+class TestHuffmanEmptyInput(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.source = os.path.join(self.tmpdir, "empty.txt")
+        open(self.source, "w").close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir, name)
+
+    def test_legacy_round_trip(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            codebook, _, _ = huff.compress(self.source, self.path("empty.bin"))
+            huff.decompress(self.path("empty.bin"), self.path("out.txt"), codebook)
+        self.assertEqual(codebook, {})
+        self.assertTrue(huff.compare_files(self.source, self.path("out.txt")))
+
+    def test_container_round_trip(self):
+        for mode in huff.MODES:
+            with self.subTest(mode=mode):
+                huff.compress_file(self.source, self.path("empty.huf"), huff.BLOCK_SIZE, mode=mode)
+                huff.decompress_file(self.path("empty.huf"), self.path("out.txt"))
+                self.assertTrue(huff.compare_files(self.source, self.path("out.txt")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Deterministic synthetic text corpora for benchmarking the Huffman codec.
+
+Lines of words drawn from a vocabulary, uniformly or with Zipf frequencies,
+are generated a few thousand at a time and written straight to the file, so
+memory stays flat and the byte count is kept as chunks are written. The
+same seed and settings always give the same stream, and a smaller corpus is
+a prefix of a larger one.
+
+    python text_generator.py corpus.txt --size 1G --distribution zipf --seed 7
+"""
+import argparse
+import itertools
+import random
+
+# Some common English words
+WORDS = ["data", "compression", "algorithm", "python", "encoding", "decode",
+         "tree", "graph", "machine", "learning", "huffman", "test", "system",
+         "analysis", "network", "model", "performance", "byte", "string", "code"]
+DISTRIBUTIONS = ("uniform", "zipf")
+WORDS_PER_LINE = 50
+LINES_PER_CHUNK = 4096
+_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def parse_size(text):
+    """'5M' -> 5242880. Suffixes K, M and G are powers of 1024; a trailing B is optional."""
+    text = text.strip().upper().removesuffix("B").removesuffix("I")
+    unit = text[-1] if text and text[-1] in _UNITS else ""
+    return int(float(text[:len(text) - len(unit)]) * _UNITS[unit])
+
+
+def zipf_weights(count, exponent=1.0):
+    """Cumulative weights giving word i (from 0) probability proportional to 1 / (i + 1) ** exponent."""
+    return list(itertools.accumulate(1 / rank ** exponent for rank in range(1, count + 1)))
+
+
+def iter_chunks(size, seed=0, vocabulary=WORDS, distribution="uniform",
+                words_per_line=WORDS_PER_LINE, zipf_exponent=1.0):
+    """Yield UTF-8 chunks of whole lines until at least `size` bytes have been produced.
+
+    Generation stops at the end of the line that reaches `size`, like the
+    original generate_text.py loop.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution!r}; choose from {', '.join(DISTRIBUTIONS)}")
+    rng = random.Random(seed)
+    tokens = [word.encode("utf-8") for word in vocabulary]
+    cum_weights = zipf_weights(len(tokens), zipf_exponent) if distribution == "zipf" else None
+    per_chunk = words_per_line * LINES_PER_CHUNK
+    written = 0
+    while written < size:
+        words = rng.choices(tokens, cum_weights=cum_weights, k=per_chunk)
+        chunk = b"\n".join(b" ".join(words[i:i + words_per_line])
+                           for i in range(0, per_chunk, words_per_line)) + b"\n"
+        if written + len(chunk) > size:
+            # Keep lines up to and including the one that crosses `size`
+            chunk = chunk[:chunk.index(b"\n", size - written - 1) + 1]
+        written += len(chunk)
+        yield chunk
+
+
+def write_corpus(path, size, **options):
+    """Write a corpus of at least `size` bytes to `path`; returns the bytes written.
+
+    Keyword options are those of iter_chunks.
+    """
+    written = 0
+    with open(path, "wb") as f:
+        for chunk in iter_chunks(size, **options):
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output")
+    parser.add_argument("--size", type=parse_size, default=5 << 20, help="target size, e.g. 500K, 5M, 2G")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--vocab", help="file with one word per line (default: built-in word list)")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--zipf-exponent", type=float, default=1.0)
+    parser.add_argument("--words-per-line", type=int, default=WORDS_PER_LINE)
+    args = parser.parse_args()
+
+    vocabulary = WORDS
+    if args.vocab:
+        with open(args.vocab, encoding="utf-8") as f:
+            vocabulary = [line.strip() for line in f if line.strip()]
+    written = write_corpus(args.output, args.size, seed=args.seed, vocabulary=vocabulary,
+                           distribution=args.distribution, words_per_line=args.words_per_line,
+                           zipf_exponent=args.zipf_exponent)
+    print(f"Generated {args.output} ({written} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+--------------------------------------------------------
+StreamFlix load test: many sessions, few titles, one cold cache
+--------------------------------------------------------
+Starts every session at once against an empty VideoProxy and reports how
+many times VideoService.fetch_video actually ran, plus session latency
+percentiles. With request coalescing the fetch count equals the number of
+distinct titles however many sessions there are.
+
+    python load_test_streamflix.py --sessions 10000 --titles 20
+    python load_test_streamflix.py --mode threads --sessions 2000
+--------------------------------------------------------
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from streamFlix import MovieFactory, UserSession, VideoProxy, VideoService
+
+
+class CountingVideoService(VideoService):
+    """VideoService that counts real fetches"""
+    def __init__(self):
+        self.fetches = 0
+        self._lock = threading.Lock()
+
+    def fetch_video(self, movie_title):
+        with self._lock:
+            self.fetches += 1
+        return super().fetch_video(movie_title)
+
+
+def make_sessions(count, titles, proxy, seed=0):
+    rng = random.Random(seed)
+    movies = [MovieFactory.get_movie(f"Title {i}", "Drama", "Director", "1h 40m") for i in range(titles)]
+    return [UserSession(f"user{i}", rng.choice(movies), proxy) for i in range(count)]
+
+
+async def run_async(sessions, fetch_threads):
+    # Leaders fetch via asyncio.to_thread; size the pool so fetches never queue
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(fetch_threads))
+
+    async def timed(session):
+        start = time.perf_counter()
+        await session.watch_movie_async()
+        return time.perf_counter() - start
+    return await asyncio.gather(*(timed(session) for session in sessions))
+
+
+def run_threads(sessions):
+    latencies = [None] * len(sessions)
+    barrier = threading.Barrier(len(sessions))
+
+    def timed(i, session):
+        barrier.wait()
+        start = time.perf_counter()
+        session.watch_movie()
+        latencies[i] = time.perf_counter() - start
+
+    # Thousands of threads only need small stacks here
+    threading.stack_size(256 * 1024)
+    threads = [threading.Thread(target=timed, args=(i, s)) for i, s in enumerate(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StreamFlix concurrent session load test")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--titles", type=int, default=20, help="distinct titles the sessions pick from")
+    parser.add_argument("--mode", choices=("async", "threads"), default="async")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = CountingVideoService()
+    proxy = VideoProxy(video_service=service)
+    start = time.perf_counter()
+    # Session and proxy output would dominate the run, so it is discarded
+    with contextlib.redirect_stdout(io.StringIO()):
+        sessions = make_sessions(args.sessions, args.titles, proxy, args.seed)
+        if args.mode == "async":
+            latencies = asyncio.run(run_async(sessions, args.titles))
+        else:
+            latencies = run_threads(sessions)
+    elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{args.sessions} {args.mode} sessions over {args.titles} titles in {elapsed:.2f} s")
+    print(f"  fetch_video calls: {service.fetches}")
+    print(f"  latency p50 {cuts[49]:.3f} s  p99 {cuts[98]:.3f} s  max {max(latencies):.3f} s")
+    print(f"  proxy stats: {proxy.cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
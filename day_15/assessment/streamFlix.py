@@ -8,8 +8,14 @@ Objective:
 --------------------------------------------------------
 """
 
-import time
+import asyncio
 import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+
+from video_cache import VideoCache
 
 # ----------------------------
 # Flyweight Pattern
@@ -57,19 +63,85 @@ class VideoService:
 
 
 class VideoProxy:
-    """Proxy adds caching to reduce redundant fetches"""
-    def __init__(self):
-        self._cache = {}
-        self._video_service = VideoService()
+    """Proxy adds a bounded cache (see video_cache.py) to reduce redundant fetches.
+
+    Concurrent misses for the same title are coalesced: the first caller
+    fetches and everyone else, from threads or coroutines, waits on its future.
+    """
+    def __init__(self, cache=None, video_service=None):
+        self._cache = cache if cache is not None else VideoCache()
+        self._video_service = video_service or VideoService()
+        self._in_flight = {}  # title -> Future of the fetch in progress
+        self._lock = threading.Lock()
+        self.stats = Counter()
 
     def get_video(self, movie_title):
-        if movie_title in self._cache:
+        video, future, leader = self._lookup(movie_title)
+        if future is None:
+            return video
+        if leader:
+            self._fetch(movie_title, future)
+        return future.result()
+
+    async def get_video_async(self, movie_title):
+        """get_video for coroutines; the blocking fetch runs in a worker thread"""
+        video, future, leader = self._lookup(movie_title)
+        if future is None:
+            return video
+        if leader:
+            await asyncio.to_thread(self._fetch, movie_title, future)
+        return await asyncio.wrap_future(future)
+
+    def cache_stats(self):
+        """Hit/miss/eviction counters of the underlying cache, plus fetches and coalesced waits"""
+        return dict(self._cache.stats) | dict(self.stats)
+
+    def _lookup(self, movie_title):
+        """Return (video, None, False) on a hit, else (None, future, is_leader)"""
+        # Hits, including disk-tier reads, do not take the proxy lock
+        video = self._cache.get(movie_title)
+        if video is not None:
             print(f"Retrieved '{movie_title}' from cache.")
-        else:
+            return video, None, False
+        leader = False
+        with self._lock:
+            future = self._in_flight.get(movie_title)
+            if future is None:
+                # A fetch may have finished since the miss above; it caches before leaving _in_flight
+                video = self._cache.get(movie_title, count=False)
+                if video is None:
+                    future = self._in_flight[movie_title] = Future()
+                    # Running futures cannot be cancelled, so a cancelled waiter cannot cancel the fetch
+                    future.set_running_or_notify_cancel()
+                    self.stats["fetches"] += 1
+                    leader = True
+            else:
+                self.stats["coalesced"] += 1
+        if video is not None:
+            print(f"Retrieved '{movie_title}' from cache.")
+            return video, None, False
+        if leader:
             print(f"'{movie_title}' not in cache, fetching from video service...")
-            self._cache[movie_title] = self._video_service.fetch_video(movie_title)
+        else:
+            print(f"'{movie_title}' already being fetched, waiting for it...")
+        return None, future, leader
+
+    def _fetch(self, movie_title, future):
+        """Fetch and cache the title, then resolve future with the video or the error"""
+        try:
+            video = self._video_service.fetch_video(movie_title)
+            self._cache.put(movie_title, video)
+        except BaseException as err:
+            # Waiting callers get the error; the next request retries the fetch
+            future.set_exception(err)
+            if not isinstance(err, Exception):
+                raise
+        else:
             print(f"Cached '{movie_title}' for future use.")
-        return self._cache[movie_title]
+            future.set_result(video)
+        finally:
+            with self._lock:
+                del self._in_flight[movie_title]
 
 
 # ----------------------------
@@ -87,6 +159,14 @@ class UserSession:
         self.movie_flyweight.display_info()
         video_data = self.video_proxy.get_video(self.movie_flyweight.title)
         print(f"{self.user_name} started streaming: {video_data}")
+        return video_data
+
+    async def watch_movie_async(self):
+        print(f"\n {self.user_name} is now watching '{self.movie_flyweight.title}'")
+        self.movie_flyweight.display_info()
+        video_data = await self.video_proxy.get_video_async(self.movie_flyweight.title)
+        print(f"{self.user_name} started streaming: {video_data}")
+        return video_data
 
 
 # ----------------------------
@@ -109,3 +189,4 @@ if __name__ == "__main__":
     # Step 4: Simulate watching
     user1.watch_movie()
     user2.watch_movie()
+    print(f"\n Cache stats: {video_proxy.cache_stats()}")
@@ -0,0 +1,94 @@
+import asyncio
+import contextlib
+import io
+import threading
+import unittest
+
+from streamFlix import VideoProxy, VideoService
+from video_cache import VideoCache
+
+
+class GatedVideoService(VideoService):
+    """Fetches block until release is set, so tests control when they finish"""
+    def __init__(self):
+        self.release = threading.Event()
+        self.fetches = 0
+
+    def fetch_video(self, movie_title):
+        self.fetches += 1
+        self.release.wait(5)
+        return f"{movie_title} - data"
+
+
+class FailingCache(VideoCache):
+    def put(self, key, value):
+        raise OSError("disk full")
+
+
+class TestVideoProxyCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.service = GatedVideoService()
+        self.quiet = contextlib.redirect_stdout(io.StringIO())
+        self.quiet.__enter__()
+
+    def tearDown(self):
+        self.quiet.__exit__(None, None, None)
+
+    def test_cancelled_waiter_does_not_cancel_others(self):
+        proxy = VideoProxy(video_service=self.service)
+
+        async def scenario():
+            leader = asyncio.create_task(proxy.get_video_async("x"))
+            await asyncio.sleep(0.05)
+            cancelled = asyncio.create_task(proxy.get_video_async("x"))
+            waiter = asyncio.create_task(proxy.get_video_async("x"))
+            await asyncio.sleep(0.05)
+            cancelled.cancel()
+            await asyncio.sleep(0.05)
+            self.service.release.set()
+            return await asyncio.gather(leader, cancelled, waiter, return_exceptions=True)
+
+        leader, cancelled, waiter = asyncio.run(scenario())
+        self.assertEqual(leader, "x - data")
+        self.assertIsInstance(cancelled, asyncio.CancelledError)
+        self.assertEqual(waiter, "x - data")
+        self.assertEqual(self.service.fetches, 1)
+        self.assertEqual(proxy.get_video("x"), "x - data")
+
+    def test_failed_cache_put_releases_waiters(self):
+        proxy = VideoProxy(cache=FailingCache(), video_service=self.service)
+        results = []
+
+        def watch():
+            try:
+                results.append(proxy.get_video("x"))
+            except OSError as err:
+                results.append(err)
+
+        threads = [threading.Thread(target=watch, daemon=True) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        self.service.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(isinstance(result, OSError) for result in results))
+        self.assertEqual(proxy._in_flight, {})
+
+    def test_concurrent_threads_fetch_once(self):
+        proxy = VideoProxy(video_service=self.service)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(proxy.get_video("x")), daemon=True)
+                   for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        self.service.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(results, ["x - data"] * 20)
+        self.assertEqual(self.service.fetches, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,239 @@
+"""
+--------------------------------------------------------
+StreamFlix: bounded cache for VideoProxy
+--------------------------------------------------------
+VideoCache keeps at most max_items entries and max_bytes of values in
+memory, evicting in LRU or LFU order, and can expire entries ttl seconds
+after they were stored. Evicted entries can spill to a disk directory,
+which is checked on a memory miss and promotes hits back into memory.
+
+    cache = VideoCache("lfu", max_bytes=64 << 20, ttl=600, disk_dir="cache")
+--------------------------------------------------------
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+
+_MISSING = object()
+
+
+# ----------------------------
+# Eviction policies
+# ----------------------------
+class LRUPolicy:
+    """Evicts the entry that was used longest ago"""
+    def __init__(self):
+        self._order = OrderedDict()
+
+    def add(self, key):
+        self._order[key] = None
+
+    def touch(self, key):
+        self._order.move_to_end(key)
+
+    def remove(self, key):
+        del self._order[key]
+
+    def victim(self):
+        return next(iter(self._order))
+
+
+class LFUPolicy:
+    """Evicts the least often used entry, oldest first among ties"""
+    def __init__(self):
+        self._counts = {}
+        self._buckets = {}  # use count -> keys in the order they reached it
+        self._lowest = 0
+
+    def add(self, key):
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._lowest = 1
+
+    def touch(self, key):
+        count = self._counts[key]
+        self._unlink(key, count)
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+        if self._lowest == count and count not in self._buckets:
+            self._lowest = count + 1
+
+    def remove(self, key):
+        self._unlink(key, self._counts.pop(key))
+        if self._counts and self._lowest not in self._buckets:
+            self._lowest = min(self._buckets)
+
+    def victim(self):
+        return next(iter(self._buckets[self._lowest]))
+
+    def _unlink(self, key, count):
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+
+POLICIES = {"lru": LRUPolicy, "lfu": LFUPolicy}
+
+
+def size_of(value):
+    """Bytes a cached value accounts for: its length for str/bytes, else sys.getsizeof"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return sys.getsizeof(value)
+
+
+# ----------------------------
+# Disk tier
+# ----------------------------
+class DiskTier:
+    """Pickled entries in a directory, one file per key, each with a wall-clock deadline"""
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        name = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + ".pkl")
+
+    def get(self, key):
+        """Return (value, seconds left or None), or None if absent or expired"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                stored_key, value, deadline = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        if stored_key != key:
+            return None
+        if deadline is None:
+            return value, None
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            self.remove(key)
+            return None
+        return value, remaining
+
+    def put(self, key, value, ttl=None):
+        """Store value for ttl more seconds (forever if None)"""
+        path = self._path(key)
+        deadline = None if ttl is None else time.time() + ttl
+        # Write then rename so readers never see a half-written file
+        with open(path + ".tmp", "wb") as f:
+            pickle.dump((key, value, deadline), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(path + ".tmp", path)
+
+    def remove(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+# ----------------------------
+# Two-tier cache
+# ----------------------------
+class VideoCache:
+    """Bounded, thread-safe mapping with pluggable eviction and an optional disk tier"""
+    def __init__(self, policy="lru", max_items=128, max_bytes=None, ttl=None,
+                 disk_dir=None, sizeof=size_of, clock=time.monotonic):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown cache policy {policy!r}; choose from {', '.join(POLICIES)}")
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        self.disk = DiskTier(disk_dir) if disk_dir else None
+        self.stats = Counter()
+        self.bytes = 0
+        self._policy = POLICIES[policy]()
+        self._entries = {}  # key -> (value, size, expires)
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key, default=None, count=True):
+        """Return the cached value, trying memory then disk; default on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= self.clock():
+                self._drop(key)
+                self.stats["expirations"] += 1
+                return self._miss(default, count)
+            if entry is not None:
+                self._policy.touch(key)
+                if count:
+                    self.stats["hits"] += 1
+                return entry[0]
+            found = self.disk.get(key) if self.disk else None
+            if found is None:
+                return self._miss(default, count)
+            if count:
+                self.stats["disk_hits"] += 1
+            value, remaining = found
+            # Promote with the lifetime it has left; oversize values stay on disk only
+            if self.max_bytes is None or self.sizeof(value) <= self.max_bytes:
+                self._store(key, value, remaining)
+            return value
+
+    def _miss(self, default, count):
+        if count:
+            self.stats["misses"] += 1
+        return default
+
+    def put(self, key, value):
+        """Cache value in memory, evicting (and spilling to disk) as needed"""
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._store(key, value, self.ttl)
+
+    def remove(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if self.disk:
+                self.disk.remove(key)
+
+    def _store(self, key, value, ttl):
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Too big to ever fit in memory; keep it on disk only
+            self.stats["oversize"] += 1
+            if self.disk:
+                self.disk.put(key, value, ttl)
+            return
+        expires = None if ttl is None else self.clock() + ttl
+        self._entries[key] = (value, size, expires)
+        self._policy.add(key)
+        self.bytes += size
+        while self._over_budget():
+            victim = self._policy.victim()
+            victim_value, _, expires = self._entries[victim]
+            self._drop(victim)
+            self.stats["evictions"] += 1
+            if self.disk:
+                # Carry the remaining lifetime over, so spilling never extends it
+                self.disk.put(victim, victim_value, None if expires is None else expires - self.clock())
+                self.stats["disk_writes"] += 1
+
+    def _over_budget(self):
+        return ((self.max_items is not None and len(self._entries) > self.max_items)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes))
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._policy.remove(key)
+        self.bytes -= size